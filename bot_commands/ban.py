@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-import json
-import os
+import asyncio
+import heapq
+import random
+import re
 import time
 import logging
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 
 import discord
 from discord.ext import commands, tasks
 
+from bot_commands.jsonstore import load_json, save_json_atomic
+
+
 DURATION_UNITS = {
     "s": 1,
     "m": 60,
@@ -16,66 +21,202 @@ DURATION_UNITS = {
     "d": 60 * 60 * 24,
     "w": 60 * 60 * 24 * 7,
 }
+# unit multiplier indexed by ord(unit) - ord("a"); 0 marks an unknown unit
+_UNIT_LUT = tuple(DURATION_UNITS.get(chr(97 + i), 0) for i in range(26))
+# shape check only; parse_duration does the actual parsing
+_DUR_RE = re.compile(r"^(?:\d+[smhdw])+$", re.ASCII)
 
+SAVE_INTERVAL = 5.0  # seconds between tempbans.json writes
+UNBAN_JITTER = 30  # max seconds added to an expiry so mass tempbans don't expire together
+# due entries past this cap get a 1s follow-up tick; deferred guilds wait UNBAN_RETRY
+MAX_UNBANS_PER_TICK = 25
+UNBAN_RETRY = 30  # seconds between ticks when idle / retrying unavailable guilds
 
-def parse_duration(raw: str) -> Optional[int]:
-    raw = raw.strip().lower()
-    if not raw:
-        return None
+BAN_MEMBERS = discord.Permissions.ban_members.flag
 
-    num = ""
-    unit = ""
-    for ch in raw:
-        if ch.isdigit():
-            num += ch
-        else:
-            unit += ch
 
-    if not num or not unit or unit not in DURATION_UNITS:
-        return None
+def parse_duration(raw: str) -> Optional[int]:
+    raw = raw.strip().lower()
 
-    try:
-        value = int(num)
-        if value <= 0:
+    # fast path: the usual "<digits><unit>" shape, e.g. "2d" / "30m"
+    if 2 <= len(raw) <= 4 and raw[:-1].isdecimal():
+        idx = ord(raw[-1]) - 97
+        mult = _UNIT_LUT[idx] if 0 <= idx < 26 else 0
+        value = int(raw[:-1])
+        return value * mult if mult and value > 0 else None
+
+    # general case: explicit state machine over the bytes, so compound
+    # durations like "1h30m" or "2d5h" add up
+    total = 0
+    value = 0
+    in_digits = False
+    for b in raw.encode():
+        if 0x30 <= b <= 0x39:
+            value = value * 10 + (b - 0x30)
+            in_digits = True
+            continue
+
+        idx = b - 97
+        mult = _UNIT_LUT[idx] if in_digits and 0 <= idx < 26 else 0
+        if not mult:
             return None
-    except ValueError:
-        return None
+        total += value * mult
+        value = 0
+        in_digits = False
 
-    return value * DURATION_UNITS[unit]
+    if in_digits or total <= 0:
+        return None
+    return total
 
 
 class Ban(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.data_file = "tempbans.json"
-        self.tempbans: Dict[str, Dict[str, Dict[str, Any]]] = self._load()
+        # guild_id -> user_id -> [unban_at, reason]; str keys on disk
+        self.tempbans: Dict[int, Dict[int, List[Any]]] = self._load()
+        # min-heap of (unban_at, guild_id, user_id); stale entries are skipped lazily
+        self._heap: List[Tuple[int, int, int]] = self._build_heap()
+        self._dirty = False
+        self._last_save = 0.0
+        # bot's own Member and raw permission bits per guild, kept fresh by the listeners below
+        self._me_by_guild: Dict[int, discord.Member] = {}
+        self._me_perms: Dict[int, int] = {}
+        self._bot_id: Optional[int] = bot.user.id if bot.user is not None else None
         self.unban_task.start()
 
     def cog_unload(self) -> None:
         self.unban_task.cancel()
-
-    def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, dict):
-                    return data
-            except Exception:
-                logging.exception("Failed to load tempbans.json")
-        return {}
-
-    def _save(self) -> None:
-        try:
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(self.tempbans, f, indent=2)
-        except Exception:
-            logging.exception("Failed to save tempbans.json")
+        if self._dirty:
+            self._save(force=True)
+
+    def _load(self) -> Dict[int, Dict[int, List[Any]]]:
+        data = load_json(self.data_file)
+        return self._normalize(data) if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _normalize(data: Dict[str, Any]) -> Dict[int, Dict[int, List[Any]]]:
+        """Validate the on-disk data once so the hot paths can trust it."""
+        out: Dict[int, Dict[int, List[Any]]] = {}
+        dropped = 0
+        for guild_id, users in data.items():
+            if not isinstance(users, dict) or not guild_id.isdigit():
+                dropped += 1
+                continue
+            clean: Dict[int, List[Any]] = {}
+            for user_id, entry in users.items():
+                if isinstance(entry, dict):
+                    # migrate the old {"unban_at": ..., "reason": ...} layout
+                    entry = [entry.get("unban_at"), entry.get("reason")]
+                unban_at = entry[0] if isinstance(entry, list) and entry else None
+                if type(unban_at) is not int or not user_id.isdigit():
+                    dropped += 1
+                    continue
+                clean[int(user_id)] = entry
+            if clean:
+                out[int(guild_id)] = clean
+
+        if dropped:
+            logging.warning(f"Dropped {dropped} malformed entries from tempbans.json")
+        return out
+
+    def _build_heap(self) -> List[Tuple[int, int, int]]:
+        heap = [
+            (entry[0], guild_id, user_id)
+            for guild_id, users in self.tempbans.items()
+            for user_id, entry in users.items()
+        ]
+        heapq.heapify(heap)
+        return heap
+
+    def _save(self, force: bool = False) -> None:
+        # debounce: writes within SAVE_INTERVAL are picked up by the next unban_task tick
+        self._dirty = True
+        if not force and time.monotonic() - self._last_save < SAVE_INTERVAL:
+            return
+
+        # fsync before the rename, so a crash leaves either the old or the new file
+        if save_json_atomic(self.data_file, self.tempbans, fsync=True):
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+    def _clear_schedule(self, guild_id: int, user_id: int) -> bool:
+        """
+        Drop a pending tempban (used by the Unban cog).
+        Returns True if something was removed; the heap entry goes stale.
+        """
+        users = self.tempbans.get(guild_id)
+        if not users or users.pop(user_id, None) is None:
+            return False
+        if not users:
+            self.tempbans.pop(guild_id)
+        self._save()
+        return True
+
+    # ---------- bot member cache ----------
+    def _remember_me(self, me: discord.Member) -> None:
+        self._me_by_guild[me.guild.id] = me
+        self._me_perms[me.guild.id] = me.guild_permissions.value
+
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        if self.bot.user is not None:
+            self._bot_id = self.bot.user.id
+        for guild in self.bot.guilds:
+            if guild.me is not None:
+                self._remember_me(guild.me)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        if guild.me is not None:
+            self._remember_me(guild.me)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self._me_by_guild.pop(guild.id, None)
+        self._me_perms.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_update(
+        self, before: discord.Member, after: discord.Member
+    ) -> None:
+        if after.id == self._bot_id:
+            self._remember_me(after)
+
+    def _refresh_me(self, guild_id: int) -> None:
+        # role changes can change the bot's effective permissions without a member update
+        me = self._me_by_guild.get(guild_id)
+        if me is not None:
+            self._remember_me(me)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(
+        self, before: discord.Role, after: discord.Role
+    ) -> None:
+        self._refresh_me(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        self._refresh_me(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self._refresh_me(role.guild.id)
 
     def _get_me_member(self, guild: discord.Guild) -> Optional[discord.Member]:
-        if self.bot.user is None:
-            return None
-        return guild.me or guild.get_member(self.bot.user.id)
+        me = self._me_by_guild.get(guild.id)
+        if me is not None:
+            return me
+
+        # cache miss (e.g. before on_ready): fall back to the guild lookup
+        if self._bot_id is None:
+            if self.bot.user is None:
+                return None
+            self._bot_id = self.bot.user.id
+        me = guild.me or guild.get_member(self._bot_id)
+        if me is not None:
+            self._remember_me(me)
+        return me
 
     def _can_ban(
         self, ctx: commands.Context, member: discord.Member
@@ -88,10 +229,13 @@ class Ban(commands.Cog):
         if me is None:
             return False, "Bot member object not available yet. Try again in a moment."
 
-        if not me.guild_permissions.ban_members:
-            return False, "I don't have **Ban Members** permission."
+        if not self._me_perms.get(guild.id, 0) & BAN_MEMBERS:
+            # re-check live before refusing, in case the cached bits are stale
+            self._remember_me(me)
+            if not self._me_perms[guild.id] & BAN_MEMBERS:
+                return False, "I don't have **Ban Members** permission."
 
-        if self.bot.user is not None and member.id == self.bot.user.id:
+        if member.id == me.id:
             return False, "Nope. I’m not banning myself."
         if member.id == ctx.author.id:
             return False, "You can’t ban yourself. Be serious."
@@ -111,55 +255,93 @@ class Ban(commands.Cog):
 
         return True, ""
 
-    @tasks.loop(seconds=30)
+    async def _do_unban(self, guild: discord.Guild, user_id: int) -> None:
+        try:
+            await guild.unban(discord.Object(id=user_id), reason="Tempban expired")
+            logging.info(f"Auto-unbanned user {user_id} in guild {guild.id}")
+        except discord.NotFound:
+            pass
+        except discord.Forbidden:
+            logging.warning(f"Missing permission to unban in guild {guild.id}")
+        except Exception:
+            logging.exception("Failed auto-unban")
+
+    @tasks.loop(seconds=UNBAN_RETRY)
     async def unban_task(self) -> None:
         await self.bot.wait_until_ready()
 
-        now = int(time.time())
-        changed = False
+        now = time.time_ns() // 1_000_000_000
+        due: List[Tuple[discord.Guild, int, int, int]] = []
+        deferred: List[Tuple[int, int, int]] = []
+
+        # pass 1: pop due entries off the heap without touching the dicts
+        while (
+            self._heap
+            and self._heap[0][0] <= now
+            and len(due) < MAX_UNBANS_PER_TICK
+        ):
+            unban_at, guild_id, user_id = heapq.heappop(self._heap)
+
+            users = self.tempbans.get(guild_id)
+            entry = users.get(user_id) if users else None
+            if entry is None or entry[0] != unban_at:
+                # already unbanned, or re-banned with a new expiry
+                continue
 
-        for guild_id, users in list(self.tempbans.items()):
-            guild = self.bot.get_guild(int(guild_id))
+            guild = self.bot.get_guild(guild_id)
             if guild is None:
+                # guild not available right now; retry on a later tick
+                deferred.append((unban_at, guild_id, user_id))
                 continue
 
-            for user_id, entry in list(users.items()):
-                unban_at = entry.get("unban_at")
-                if not isinstance(unban_at, int):
-                    users.pop(user_id, None)
-                    changed = True
-                    continue
+            due.append((guild, guild_id, user_id, unban_at))
+
+        # decide the next wake-up before the deferred entries go back on the heap:
+        # anything still due here was left behind by the per-tick cap, and only
+        # that backlog (not unavailable guilds) is worth a 1s follow-up tick
+        backlog = bool(self._heap) and self._heap[0][0] <= now
+        next_at = self._heap[0][0] if self._heap else None
+
+        for item in deferred:
+            heapq.heappush(self._heap, item)
 
-                if now >= unban_at:
-                    try:
-                        await guild.unban(
-                            discord.Object(id=int(user_id)), reason="Tempban expired"
-                        )
-                        logging.info(
-                            f"Auto-unbanned user {user_id} in guild {guild_id}"
-                        )
-                    except discord.NotFound:
-                        pass
-                    except discord.Forbidden:
-                        logging.warning(
-                            f"Missing permission to unban in guild {guild_id}"
-                        )
-                    except Exception:
-                        logging.exception("Failed auto-unban")
-
-                    users.pop(user_id, None)
-                    changed = True
+        # pass 2: unban concurrently so one slow guild doesn't hold up the rest,
+        # then drop the entries (and any emptied guilds)
+        await asyncio.gather(
+            *(self._do_unban(guild, user_id) for guild, _, user_id, _ in due),
+            return_exceptions=True,
+        )
 
+        changed = False
+        for _, guild_id, user_id, unban_at in due:
+            users = self.tempbans.get(guild_id)
+            if users is None:
+                continue
+            entry = users.get(user_id)
+            if entry is not None and entry[0] == unban_at:
+                users.pop(user_id)
+                changed = True
             if not users:
-                self.tempbans.pop(guild_id, None)
+                self.tempbans.pop(guild_id)
                 changed = True
 
-        if changed:
+        if changed or self._dirty:
             self._save()
 
+        # sleep until the next expiry, but never longer than UNBAN_RETRY, which is
+        # also how often entries for unavailable guilds get retried
+        if backlog:
+            self.unban_task.change_interval(seconds=1)
+        elif next_at is not None:
+            self.unban_task.change_interval(
+                seconds=max(1, min(UNBAN_RETRY, next_at - now))
+            )
+        else:
+            self.unban_task.change_interval(seconds=UNBAN_RETRY)
+
     @commands.command(
         name="ban",
-        help="Ban permanently OR temporarily.\nUsage: !ban @user [duration] [reason]\nExample: !ban @user 2d spamming",
+        help="Ban permanently OR temporarily.\nUsage: !ban @user [duration] [reason]\nExample: !ban @user 2d spamming (durations can combine: 1h30m)",
     )
     @commands.guild_only()
     @commands.has_permissions(ban_members=True)
@@ -181,41 +363,49 @@ class Ban(commands.Cog):
             return await ctx.send(msg)
 
         seconds: Optional[int] = None
-        if duration:
+        if duration is not None and _DUR_RE.match(duration.strip().lower()):
             seconds = parse_duration(duration)
-
-            if seconds is None and reason is None:
-                reason = duration
-                duration = None
-
-            if duration is not None and seconds is None and reason is not None:
+            if seconds is None:
                 return await ctx.send(
-                    "Invalid duration. Use: `30s`, `10m`, `2h`, `3d`, `1w`"
+                    "Invalid duration. Use: `30s`, `10m`, `2h`, `3d`, `1w` or `1h30m`"
                 )
+        elif duration is not None:
+            # common case: permanent ban, the second token starts the reason
+            if duration[0].isdigit():
+                return await ctx.send(
+                    "Invalid duration. Use: `30s`, `10m`, `2h`, `3d`, `1w` or `1h30m`"
+                )
+            reason = f"{duration} {reason}" if reason else duration
+            duration = None
 
         ban_reason = reason or "No reason provided."
 
         try:
-            if seconds is not None and duration is not None:
-                unban_at = int(time.time()) + seconds
-                gkey = str(guild.id)  # <- FIX: uses local guild var (not Optional)
-                ukey = str(member.id)
-
-                self.tempbans.setdefault(gkey, {})
-                self.tempbans[gkey][ukey] = {"unban_at": unban_at, "reason": ban_reason}
-                self._save()
-
-                await member.ban(
-                    reason=f"[TEMPBAN {duration}] {ban_reason}", delete_message_days=0
-                )
-                return await ctx.send(
-                    f"✅ Tempbanned {member.mention} for **{duration}**. Reason: {ban_reason}"
-                )
+            if seconds is None or duration is None:
+                await member.ban(reason=ban_reason, delete_message_days=0)
+                return await ctx.send(f"✅ Banned {member.mention}. Reason: {ban_reason}")
+
+            # jitter scales with the duration so short tempbans stay accurate
+            jitter = random.randint(0, min(UNBAN_JITTER, seconds // 10))
+            unban_at = time.time_ns() // 1_000_000_000 + seconds + jitter
+            gkey = guild.id  # <- FIX: uses local guild var (not Optional)
+            ukey = member.id
+
+            self.tempbans.setdefault(gkey, {})
+            self.tempbans[gkey][ukey] = [unban_at, ban_reason]
+            heapq.heappush(self._heap, (unban_at, gkey, ukey))
+            self._save()
 
-            await member.ban(reason=ban_reason, delete_message_days=0)
-            await ctx.send(f"✅ Banned {member.mention}. Reason: {ban_reason}")
+            await member.ban(
+                reason=f"[TEMPBAN {duration}] {ban_reason}", delete_message_days=0
+            )
+            await ctx.send(
+                f"✅ Tempbanned {member.mention} for **{duration}**. Reason: {ban_reason}"
+            )
 
         except discord.Forbidden:
+            # the cached permissions may have gone stale; recompute for next time
+            self._refresh_me(guild.id)
             await ctx.send("❌ I can’t ban that user (permissions/role hierarchy).")
         except discord.HTTPException as e:
             await ctx.send(f"❌ Discord API error while banning: `{e}`")
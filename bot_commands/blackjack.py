@@ -5,28 +5,65 @@ import json
 import logging
 import os
 import random
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Set, Tuple
 
 import discord
 from discord.ext import commands
 
+try:
+    import orjson  # optional: faster player data load/save
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logging.basicConfig(level=logging.INFO)
 
 DEFAULT_BALANCE = 1_000_000.0
+# end-of-round result -> (stat to bump, balance sign, title, description, colour)
+_OUTCOMES: Dict[int, Tuple[str, int, str, str, discord.Color]] = {
+    2: ("wins", 1, "🎉 You Win!", "Dealer busted.", discord.Color.green()),
+    1: ("wins", 1, "🎉 You Win!", "Higher total.", discord.Color.green()),
+    0: ("ties", 0, "🤝 Tie", "Same total.", discord.Color.greyple()),
+    -1: ("losses", -1, "😞 You Lose", "Dealer higher total.", discord.Color.red()),
+}
+
+# one deck as card values (Ace = 11); shuffled copies are dealt by index
+_DECK_TEMPLATE = bytes([2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11] * 4)
+
+COMPACT_EVERY = 256  # log records appended before the snapshot is rewritten
+DEALER_DRAW_DELAY = 0.4  # pause between dealer card reveals
+SAVE_DELAY = 1.0  # seconds a round's mutations are coalesced before logging
 
 
 # ---------- helpers ----------
+def adjust_for_aces(total: int, aces: int) -> int:
+    """
+    Downgrade just enough Aces from 11 to 1 to get to 21 or under (if possible).
+    """
+    excess = (total - 12) // 10 if total > 21 else 0  # ceil((total - 21) / 10)
+    return total - 10 * min(excess, aces)
+
+
 def hand_total(cards: List[int]) -> int:
     """
     Cards: 2-10, and 11 for Ace.
     Count Aces as 11, then downgrade to 1 as needed.
     """
-    total = sum(cards)
-    aces = cards.count(11)
-    while total > 21 and aces > 0:
-        total -= 10  # 11 -> 1
-        aces -= 1
-    return total
+    return adjust_for_aces(sum(cards), cards.count(11))
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS  # int user ids -> str keys, like json
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def format_money(x: float) -> str:
@@ -155,64 +192,154 @@ class Blackjack(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.data_file = "blackjack_player_data.json"
-        self.player_data: Dict[str, Dict[str, Any]] = {}
+        # append-only log of per-player records, folded into data_file by _compact
+        self.log_file = self.data_file + ".log"
+        # keyed by user id; ids are str keys only on disk
+        self.player_data: Dict[int, Dict[str, Any]] = {}
 
         self._file_lock = asyncio.Lock()
+        self._log_records = 0
+        self._compact_task: Optional[asyncio.Task] = None
+        self._dirty: Set[int] = set()  # players with unsaved mutations
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_tasks: Set[asyncio.Task] = set()
         self._active_games: Dict[int, asyncio.Lock] = {}  # per-user lock
 
-        # basic emoji mapping for 2-11 (Ace)
-        self.card_emojis = {
-            2: "🂢",
-            3: "🂣",
-            4: "🂤",
-            5: "🂥",
-            6: "🂦",
-            7: "🂧",
-            8: "🂨",
-            9: "🂩",
-            10: "🂪",
-            11: "🂡",
-        }
+        # basic emoji mapping for 2-11 (Ace), indexed by card value
+        self.card_emojis = (
+            "",
+            "",
+            "🂢",
+            "🂣",
+            "🂤",
+            "🂥",
+            "🂦",
+            "🂧",
+            "🂨",
+            "🂩",
+            "🂪",
+            "🂡",
+        )
 
         self._load_data()
+        self._log_fh = open(self.log_file, "ab")
+
+    async def cog_unload(self):
+        await self._flush_saves()
+        await self._compact()
+        self._log_fh.close()
 
     # ---- persistence ----
     def _load_data(self):
-        if os.path.exists(self.data_file):
+        self.player_data = {}
+        try:
+            with open(self.data_file, "rb") as f:
+                data = _loads(f.read())
+            if isinstance(data, dict):
+                self.player_data = {int(k): v for k, v in data.items()}
+            logging.info("Blackjack data loaded.")
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logging.exception("Failed to load blackjack data.")
+
+        # replay records written since the last snapshot
+        try:
+            with open(self.log_file, "rb") as f:
+                skipped = 0
+                for line in f:
+                    try:
+                        rec = _loads(line)
+                        uid, d = int(rec["uid"]), rec["d"]
+                    except (ValueError, TypeError, KeyError):
+                        # torn last line after a crash, or a malformed record:
+                        # skip just this one, later records are still good
+                        skipped += 1
+                        continue
+                    if not isinstance(d, dict):
+                        skipped += 1
+                        continue
+                    self.player_data[uid] = d
+                    self._log_records += 1
+                if skipped:
+                    logging.warning(
+                        f"Skipped {skipped} malformed blackjack log records."
+                    )
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logging.exception("Failed to replay blackjack log.")
+
+    async def _save_data(self, user_id: int):
+        # append just this player's record; the full file is rewritten on compaction
+        async with self._file_lock:
             try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, dict):
-                    self.player_data = data
-                else:
-                    self.player_data = {}
-                logging.info("Blackjack data loaded.")
+                self._log_fh.write(
+                    _dumps({"uid": user_id, "d": self.player_data[user_id]}) + b"\n"
+                )
+                self._log_fh.flush()
+                self._log_records += 1
             except Exception:
-                logging.exception("Failed to load blackjack data.")
-                self.player_data = {}
-        else:
-            self.player_data = {}
+                logging.exception("Failed to save blackjack data.")
 
-    async def _save_data(self):
-        # atomic write to avoid corruption
+        if self._log_records >= COMPACT_EVERY and (
+            self._compact_task is None or self._compact_task.done()
+        ):
+            self._compact_task = asyncio.create_task(self._compact())
+
+    def _schedule_save(self, user_id: int):
+        # coalesce a round's mutations into one log record per player
+        self._dirty.add(user_id)
+        if self._save_handle is None:
+            self._save_handle = asyncio.get_running_loop().call_later(
+                SAVE_DELAY, self._spawn_flush
+            )
+
+    def _spawn_flush(self):
+        self._save_handle = None
+        task = asyncio.create_task(self._flush_saves())
+        self._save_tasks.add(task)
+        task.add_done_callback(self._save_tasks.discard)
+
+    async def _flush_saves(self):
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        dirty, self._dirty = self._dirty, set()
+        for user_id in dirty:
+            await self._save_data(user_id)
+
+    async def _compact(self):
+        # serialize + write off the event loop; the copy keeps the thread away
+        # from records that are mutated while it runs
+        snapshot = {k: dict(v) for k, v in self.player_data.items()}
         async with self._file_lock:
-            tmp = self.data_file + ".tmp"
+            if await asyncio.to_thread(self._write_snapshot, snapshot):
+                # the snapshot now contains everything logged so far
+                self._log_fh.seek(0)
+                self._log_fh.truncate()
+                self._log_records = 0
+
+    def _write_snapshot(self, snapshot: Dict[int, Dict[str, Any]]) -> bool:
+        # atomic write to avoid corruption
+        tmp = self.data_file + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(_dumps(snapshot, pretty=True))
+            os.replace(tmp, self.data_file)
+            return True
+        except Exception:
+            logging.exception("Failed to save blackjack data.")
             try:
-                with open(tmp, "w", encoding="utf-8") as f:
-                    json.dump(self.player_data, f, indent=2)
-                os.replace(tmp, self.data_file)
+                if os.path.exists(tmp):
+                    os.remove(tmp)
             except Exception:
-                logging.exception("Failed to save blackjack data.")
-                try:
-                    if os.path.exists(tmp):
-                        os.remove(tmp)
-                except Exception:
-                    pass
+                pass
+            return False
 
     def _ensure_player(self, user_id: int):
-        key = str(user_id)
-        if key not in self.player_data:
-            self.player_data[key] = {
+        if user_id not in self.player_data:
+            self.player_data[user_id] = {
                 "balance": DEFAULT_BALANCE,
                 "wins": 0,
                 "losses": 0,
@@ -223,11 +350,11 @@ class Blackjack(commands.Cog):
         """
         If user is bankrupt (<=0), reset balance for next time and return True.
         """
-        pdata = self.player_data[str(user_id)]
+        pdata = self.player_data[user_id]
         bal = float(pdata["balance"])
         if bal <= 0:
             pdata["balance"] = DEFAULT_BALANCE
-            await self._save_data()
+            await self._save_data(user_id)
             return True
         return False
 
@@ -249,7 +376,7 @@ class Blackjack(commands.Cog):
         return embed
 
     def cards_str(self, cards: List[int]) -> str:
-        return " ".join(self.card_emojis.get(c, str(c)) for c in cards)
+        return " ".join([self.card_emojis[c] for c in cards])
 
     # ---- game ----
     def _get_user_lock(self, user_id: int) -> asyncio.Lock:
@@ -257,10 +384,8 @@ class Blackjack(commands.Cog):
             self._active_games[user_id] = asyncio.Lock()
         return self._active_games[user_id]
 
-    def _build_deck(self) -> List[int]:
-        deck = [2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11] * 4
-        random.shuffle(deck)
-        return deck
+    def _build_deck(self) -> bytearray:
+        return bytearray(random.sample(_DECK_TEMPLATE, len(_DECK_TEMPLATE)))
 
     async def _prompt_custom_bet(
         self, ctx: commands.Context, balance: float
@@ -315,31 +440,23 @@ class Blackjack(commands.Cog):
         user_id = ctx.author.id
         self._ensure_player(user_id)
 
-        pdata = self.player_data[str(user_id)]
-
-        # Safety reset if someone saved nonsense
-        if float(pdata["balance"]) <= 0:
-            pdata["balance"] = DEFAULT_BALANCE
-            await self._save_data()
+        pdata = self.player_data[user_id]
 
+        # converted once; kept in sync with pdata["balance"] on every change
         balance = float(pdata["balance"])
 
-        await ctx.send(
-            embed=self.make_embed(
-                "🎰 Blackjack",
-                f"Welcome, {ctx.author.mention}!",
-                discord.Color.green(),
-                fields=[("💰 Balance", format_money(balance), True)],
-            )
-        )
+        # Safety reset if someone saved nonsense
+        if balance <= 0:
+            balance = pdata["balance"] = DEFAULT_BALANCE
+            self._schedule_save(user_id)
 
-        # Bet selection
+        # Welcome + bet selection in one message
         bet_view = BetView(ctx, balance)
         bet_embed = self.make_embed(
-            "💸 Place Your Bet",
-            "Pick a bet with buttons.",
-            discord.Color.blurple(),
-            fields=[("Available", format_money(balance), True)],
+            "🎰 Blackjack",
+            f"Welcome, {ctx.author.mention}!\nPick a bet with buttons.",
+            discord.Color.green(),
+            fields=[("💰 Balance", format_money(balance), True)],
         )
         await ctx.send(embed=bet_embed, view=bet_view)
         await bet_view.wait()
@@ -363,32 +480,30 @@ class Blackjack(commands.Cog):
             )
             return False
 
-        await ctx.send(
-            embed=self.make_embed(
-                "✅ Bet Placed",
-                f"You bet {format_money(bet_amount)}.",
-                discord.Color.green(),
-            )
-        )
-
         deck = self._build_deck()
-        player_cards = [deck.pop(), deck.pop()]
-        dealer_cards = [deck.pop(), deck.pop()]  # one hidden initially
+        player_cards = [deck[0], deck[1]]
+        dealer_cards = [deck[2], deck[3]]  # one hidden initially
+        next_card = 4  # index of the next card to deal
+
+        # hands only grow, so keep their rendering up to date as cards are dealt
+        player_render = self.cards_str(player_cards)
+        dealer_render = self.cards_str(dealer_cards)
 
         player_total = hand_total(player_cards)
         dealer_total = hand_total(dealer_cards)
 
-        hidden_dealer = f"{self.cards_str([dealer_cards[0]])} ❓"
-        await ctx.send(
+        hidden_dealer = f"{self.card_emojis[dealer_cards[0]]} ❓"
+        # bet confirmation + opening hands; the player's turn edits this message
+        game_msg = await ctx.send(
             embed=self.make_embed(
                 "🃏 Game Start",
-                "Hit or stand.",
+                f"✅ You bet {format_money(bet_amount)}. Hit or stand.",
                 discord.Color.blurple(),
                 fields=[
                     ("Dealer", hidden_dealer, False),
                     (
                         "You",
-                        f"{self.cards_str(player_cards)} (Total: {player_total})",
+                        f"{player_render} (Total: {player_total})",
                         False,
                     ),
                 ],
@@ -401,7 +516,7 @@ class Blackjack(commands.Cog):
 
         if player_blackjack and dealer_blackjack:
             pdata["ties"] += 1
-            await self._save_data()
+            self._schedule_save(user_id)
             await ctx.send(
                 embed=self.make_embed(
                     "🤝 Tie",
@@ -410,12 +525,12 @@ class Blackjack(commands.Cog):
                     fields=[
                         (
                             "Dealer",
-                            f"{self.cards_str(dealer_cards)} (Total: {dealer_total})",
+                            f"{dealer_render} (Total: {dealer_total})",
                             False,
                         ),
                         (
                             "You",
-                            f"{self.cards_str(player_cards)} (Total: {player_total})",
+                            f"{player_render} (Total: {player_total})",
                             False,
                         ),
                     ],
@@ -426,8 +541,9 @@ class Blackjack(commands.Cog):
         if player_blackjack:
             payout = 1.5 * bet_amount
             pdata["wins"] += 1
-            pdata["balance"] = float(pdata["balance"]) + payout
-            await self._save_data()
+            balance += payout
+            pdata["balance"] = balance
+            self._schedule_save(user_id)
             await ctx.send(
                 embed=self.make_embed(
                     "🏆 Blackjack!",
@@ -436,10 +552,10 @@ class Blackjack(commands.Cog):
                     fields=[
                         (
                             "You",
-                            f"{self.cards_str(player_cards)} (Total: {player_total})",
+                            f"{player_render} (Total: {player_total})",
                             False,
                         ),
-                        ("New Balance", format_money(float(pdata["balance"])), True),
+                        ("New Balance", format_money(balance), True),
                     ],
                 )
             )
@@ -447,8 +563,9 @@ class Blackjack(commands.Cog):
 
         if dealer_blackjack:
             pdata["losses"] += 1
-            pdata["balance"] = float(pdata["balance"]) - bet_amount
-            await self._save_data()
+            balance -= bet_amount
+            pdata["balance"] = balance
+            self._schedule_save(user_id)
             await ctx.send(
                 embed=self.make_embed(
                     "😞 Dealer Blackjack",
@@ -457,15 +574,15 @@ class Blackjack(commands.Cog):
                     fields=[
                         (
                             "Dealer",
-                            f"{self.cards_str(dealer_cards)} (Total: {dealer_total})",
+                            f"{dealer_render} (Total: {dealer_total})",
                             False,
                         ),
                         (
                             "You",
-                            f"{self.cards_str(player_cards)} (Total: {player_total})",
+                            f"{player_render} (Total: {player_total})",
                             False,
                         ),
-                        ("New Balance", format_money(float(pdata["balance"])), True),
+                        ("New Balance", format_money(balance), True),
                     ],
                 )
             )
@@ -478,7 +595,7 @@ class Blackjack(commands.Cog):
                 break
 
             action_view = ActionView(ctx)
-            await ctx.send(
+            await game_msg.edit(
                 embed=self.make_embed(
                     "🃏 Your Turn",
                     "Choose: Hit or Stand",
@@ -487,7 +604,7 @@ class Blackjack(commands.Cog):
                         ("Dealer", hidden_dealer, False),
                         (
                             "You",
-                            f"{self.cards_str(player_cards)} (Total: {player_total})",
+                            f"{player_render} (Total: {player_total})",
                             False,
                         ),
                     ],
@@ -509,15 +626,19 @@ class Blackjack(commands.Cog):
             if action_view.action == "stand":
                 break
 
-            player_cards.append(deck.pop())
+            card = deck[next_card]
+            next_card += 1
+            player_cards.append(card)
+            player_render += " " + self.card_emojis[card]
 
         player_total = hand_total(player_cards)
 
         # Player busts
         if player_total > 21:
             pdata["losses"] += 1
-            pdata["balance"] = float(pdata["balance"]) - bet_amount
-            await self._save_data()
+            balance -= bet_amount
+            pdata["balance"] = balance
+            self._schedule_save(user_id)
 
             await ctx.send(
                 embed=self.make_embed(
@@ -527,17 +648,17 @@ class Blackjack(commands.Cog):
                     fields=[
                         (
                             "You",
-                            f"{self.cards_str(player_cards)} (Total: {player_total})",
+                            f"{player_render} (Total: {player_total})",
                             False,
                         ),
-                        ("New Balance", format_money(float(pdata["balance"])), True),
+                        ("New Balance", format_money(balance), True),
                     ],
                 )
             )
             return True
 
-        # Dealer reveal & play
-        await ctx.send(
+        # Dealer reveal & play, all in one message that is edited per draw
+        dealer_msg = await ctx.send(
             embed=self.make_embed(
                 "🃏 Dealer Reveals",
                 "Dealer plays.",
@@ -545,7 +666,7 @@ class Blackjack(commands.Cog):
                 fields=[
                     (
                         "Dealer",
-                        f"{self.cards_str(dealer_cards)} (Total: {dealer_total})",
+                        f"{dealer_render} (Total: {dealer_total})",
                         False,
                     )
                 ],
@@ -553,9 +674,13 @@ class Blackjack(commands.Cog):
         )
 
         while hand_total(dealer_cards) < 17:
-            dealer_cards.append(deck.pop())
+            await asyncio.sleep(DEALER_DRAW_DELAY)
+            card = deck[next_card]
+            next_card += 1
+            dealer_cards.append(card)
+            dealer_render += " " + self.card_emojis[card]
             dealer_total = hand_total(dealer_cards)
-            await ctx.send(
+            await dealer_msg.edit(
                 embed=self.make_embed(
                     "🃏 Dealer Draws",
                     "Dealer draws a card.",
@@ -563,40 +688,31 @@ class Blackjack(commands.Cog):
                     fields=[
                         (
                             "Dealer",
-                            f"{self.cards_str(dealer_cards)} (Total: {dealer_total})",
+                            f"{dealer_render} (Total: {dealer_total})",
                             False,
                         )
                     ],
                 )
             )
-            await asyncio.sleep(1)
 
         dealer_total = hand_total(dealer_cards)
 
-        # Outcome
-        if dealer_total > 21:
-            pdata["wins"] += 1
-            pdata["balance"] = float(pdata["balance"]) + bet_amount
-            title, desc, color = "🎉 You Win!", "Dealer busted.", discord.Color.green()
-        elif dealer_total == player_total:
-            pdata["ties"] += 1
-            title, desc, color = "🤝 Tie", "Same total.", discord.Color.greyple()
-        elif dealer_total > player_total:
-            pdata["losses"] += 1
-            pdata["balance"] = float(pdata["balance"]) - bet_amount
-            title, desc, color = (
-                "😞 You Lose",
-                "Dealer higher total.",
-                discord.Color.red(),
-            )
-        else:
-            pdata["wins"] += 1
-            pdata["balance"] = float(pdata["balance"]) + bet_amount
-            title, desc, color = "🎉 You Win!", "Higher total.", discord.Color.green()
+        # Outcome: 2 = dealer bust, otherwise sign(player - dealer)
+        outcome = (
+            2
+            if dealer_total > 21
+            else (player_total > dealer_total) - (player_total < dealer_total)
+        )
+        stat, sign, title, desc, color = _OUTCOMES[outcome]
+        pdata[stat] += 1
+        if sign:
+            balance += sign * bet_amount
+            pdata["balance"] = balance
 
-        await self._save_data()
+        self._schedule_save(user_id)
 
-        await ctx.send(
+        await asyncio.sleep(DEALER_DRAW_DELAY)
+        await dealer_msg.edit(
             embed=self.make_embed(
                 title,
                 desc,
@@ -604,15 +720,15 @@ class Blackjack(commands.Cog):
                 fields=[
                     (
                         "Dealer",
-                        f"{self.cards_str(dealer_cards)} (Total: {dealer_total})",
+                        f"{dealer_render} (Total: {dealer_total})",
                         False,
                     ),
                     (
                         "You",
-                        f"{self.cards_str(player_cards)} (Total: {player_total})",
+                        f"{player_render} (Total: {player_total})",
                         False,
                     ),
-                    ("Balance", format_money(float(pdata["balance"])), True),
+                    ("Balance", format_money(balance), True),
                 ],
             )
         )
@@ -626,7 +742,7 @@ class Blackjack(commands.Cog):
         Also enforces your bankruptcy rule: if balance <= 0 -> end + reset.
         """
         user_id = ctx.author.id
-        pdata = self.player_data[str(user_id)]
+        pdata = self.player_data[user_id]
         bal = float(pdata["balance"])
 
         await ctx.send(
@@ -646,7 +762,7 @@ class Blackjack(commands.Cog):
         # Your rule: bankrupt ends game AND resets for next time
         if bal <= 0:
             pdata["balance"] = DEFAULT_BALANCE
-            await self._save_data()
+            await self._save_data(user_id)
 
             await ctx.send(
                 embed=self.make_embed(
@@ -678,39 +794,48 @@ class Blackjack(commands.Cog):
             )
 
         async with lock:
-            self._ensure_player(ctx.author.id)
-
-            # Extra safety reset if player is bankrupt before starting
-            if await self._reset_if_bankrupt(ctx.author.id):
-                await ctx.send(
-                    embed=self.make_embed(
-                        "💰 Balance Reset",
-                        f"Your balance was {format_money(0)}. Reset to {format_money(DEFAULT_BALANCE)}.",
-                        discord.Color.green(),
-                    )
-                )
+            try:
+                self._ensure_player(ctx.author.id)
 
-            while True:
-                completed = await self._play_round(ctx)
-                if not completed:
-                    # canceled/timeout => stop cleanly
+                # Extra safety reset if player is bankrupt before starting
+                if await self._reset_if_bankrupt(ctx.author.id):
                     await ctx.send(
                         embed=self.make_embed(
-                            "👋 Goodbye", "Game ended.", discord.Color.blurple()
+                            "💰 Balance Reset",
+                            f"Your balance was {format_money(0)}. Reset to {format_money(DEFAULT_BALANCE)}.",
+                            discord.Color.green(),
                         )
                     )
-                    break
 
-                again = await self._stats_and_maybe_continue(ctx)
-                if not again:
-                    await ctx.send(
-                        embed=self.make_embed(
-                            "👋 Goodbye",
-                            "Thanks for playing Blackjack!",
-                            discord.Color.blurple(),
+                while True:
+                    completed = await self._play_round(ctx)
+                    if not completed:
+                        # canceled/timeout => stop cleanly
+                        await ctx.send(
+                            embed=self.make_embed(
+                                "👋 Goodbye", "Game ended.", discord.Color.blurple()
+                            )
                         )
-                    )
-                    break
+                        break
+
+                    again = await self._stats_and_maybe_continue(ctx)
+                    if not again:
+                        await ctx.send(
+                            embed=self.make_embed(
+                                "👋 Goodbye",
+                                "Thanks for playing Blackjack!",
+                                discord.Color.blurple(),
+                            )
+                        )
+                        break
+            finally:
+                try:
+                    # session over: don't leave this player's record waiting on the timer
+                    await self._flush_saves()
+                finally:
+                    # and don't keep a lock around for every user who ever played,
+                    # even if the flush failed
+                    self._active_games.pop(ctx.author.id, None)
 
 
 async def setup(bot: commands.Bot):
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import re
 from datetime import timedelta
-from typing import Optional, List
+from typing import Callable, List, Optional
 
 import discord
 from discord.ext import commands
 
-MAX_CLEAR = 100
+MAX_CLEAR = 1000
+BULK_DELETE_MAX = 100  # Discord's per-call bulk delete limit
+BULK_DELETE_DELAY = 1.1  # seconds between slabs (bulk delete is ~1/sec per guild)
 CONFIRM_DELETE_AFTER = 4  # seconds
 
 
-def is_older_than_14_days(msg: discord.Message) -> bool:
-    return (discord.utils.utcnow() - msg.created_at) >= timedelta(days=14)
-
-
 class Clear(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -77,17 +77,13 @@ class Clear(commands.Cog):
         mode: str = "normal"
         member: Optional[discord.Member] = None
 
-        # Combine tail for flag parsing
-        full_tail = ""
-        if target:
-            full_tail += target
-        if rest:
-            full_tail += " " + rest
-        full_tail = full_tail.strip()
-
-        if "--dry" in full_tail:
+        # Split flags from positionals on whole tokens (so "--dryrun" isn't "--dry")
+        tokens = (target or "").split() + (rest or "").split()
+        if "--dry" in tokens:
             dry_run = True
-            full_tail = full_tail.replace("--dry", "").strip()
+            tokens = [t for t in tokens if t != "--dry"]
+            target = tokens[0] if tokens else None
+            rest = " ".join(tokens[1:]) or None
 
         # 1) Mention user (ensure Member, not User)
         if ctx.message.mentions:
@@ -117,42 +113,56 @@ class Clear(commands.Cog):
         else:
             mode = "normal"
 
-        # ---- fetch messages ----
-        fetch_limit = min(200, amount * 4)  # fetch extra to account for filtering
-        messages: List[discord.Message] = []
-
-        async for msg in ctx.channel.history(limit=fetch_limit):  # type: ignore[attr-defined]
-            if msg.id == ctx.message.id:
-                continue  # don't delete the command message automatically
-            messages.append(msg)
-
-        # ---- filter messages ----
+        # ---- select (+ delete) ----
+        fetch_limit = min(MAX_CLEAR * 2, amount * 4)  # fetch extra to account for filtering
+        counts = {"kept": 0, "old": 0}
+        # bulk delete rejects messages older than 14 days; snowflake ids are
+        # time-ordered, so one int threshold replaces a datetime per message
+        min_snowflake = discord.utils.time_snowflake(
+            discord.utils.utcnow() - timedelta(days=14), high=True
+        )
+        # compiled once; searches in place instead of lowering every message.
+        # keyword is always set in keyword mode, the only mode that calls this.
+        keyword_search = re.compile(re.escape(keyword or ""), re.IGNORECASE).search
+
+        member_id = member.id if member else 0
+
+        def _match_keyword(msg: discord.Message) -> bool:
+            return keyword_search(msg.content or "") is not None
+
+        # pick the mode's filter once instead of re-dispatching per message
+        matches: Callable[[discord.Message], bool] = {
+            "normal": lambda msg: True,
+            "user": lambda msg: msg.author.id == member_id,
+            "bots": lambda msg: msg.author.bot,
+            "keyword": _match_keyword,
+        }[mode]
+
+        def check(msg: discord.Message) -> bool:
+            # cheap mode filter first; the age check only runs on matches
+            if not matches(msg):
+                return False
+            if msg.id <= min_snowflake:
+                counts["old"] += 1
+                return False
+            counts["kept"] += 1
+            return True
+
+        # stream history and stop paginating once we have enough; starting
+        # before the command message keeps it out without a per-message check
         to_delete: List[discord.Message] = []
-        skipped_old = 0
-
-        for msg in messages:
-            if len(to_delete) >= amount:
-                break
-
-            if is_older_than_14_days(msg):
-                skipped_old += 1
-                continue
-
-            if mode == "normal":
+        history = ctx.channel.history(limit=fetch_limit, before=ctx.message)  # type: ignore[attr-defined]
+        async for msg in history:
+            if check(msg):
                 to_delete.append(msg)
-            elif mode == "user":
-                if member and msg.author.id == member.id:
-                    to_delete.append(msg)
-            elif mode == "bots":
-                if msg.author.bot:
-                    to_delete.append(msg)
-            elif mode == "keyword":
-                if keyword and keyword.lower() in (msg.content or "").lower():
-                    to_delete.append(msg)
+                if len(to_delete) >= amount:
+                    break
 
         # ---- dry run ----
         if dry_run:
-            desc = f"Would delete **{len(to_delete)}** message(s)"
+            skipped_old = counts["old"]
+
+            desc = f"Would delete **{counts['kept']}** message(s)"
             if mode == "user" and member:
                 desc += f" from **{member}**"
             elif mode == "bots":
@@ -165,22 +175,30 @@ class Clear(commands.Cog):
 
             return await ctx.send(f"🧪 Dry run: {desc}")
 
-        if not to_delete:
+        # ---- delete ----
+        deleted = to_delete
+        if deleted:
+            try:
+                for i in range(0, len(deleted), BULK_DELETE_MAX):
+                    await ctx.channel.delete_messages(  # type: ignore[attr-defined]
+                        deleted[i : i + BULK_DELETE_MAX]
+                    )
+                    if i + BULK_DELETE_MAX < len(deleted):
+                        await asyncio.sleep(BULK_DELETE_DELAY)
+            except discord.Forbidden:
+                return await ctx.send("I don’t have permission to delete messages here.")
+            except discord.HTTPException as e:
+                return await ctx.send(f"Discord API error while deleting: `{e}`")
+
+        skipped_old = counts["old"]
+        if not deleted:
             msg = "Nothing to delete."
             if skipped_old:
                 msg += f" (Skipped {skipped_old} old message(s) >14 days.)"
             return await ctx.send(msg)
 
-        # ---- delete ----
-        try:
-            await ctx.channel.delete_messages(to_delete)  # type: ignore[attr-defined]
-        except discord.Forbidden:
-            return await ctx.send("I don’t have permission to delete messages here.")
-        except discord.HTTPException as e:
-            return await ctx.send(f"Discord API error while deleting: `{e}`")
-
         # ---- confirmation ----
-        summary = f"🧹 Deleted **{len(to_delete)}** message(s)"
+        summary = f"🧹 Deleted **{len(deleted)}** message(s)"
         if mode == "user" and member:
             summary += f" from **{member}**"
         elif mode == "bots":
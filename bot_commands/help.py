@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import copy
+import functools
+
 import discord
 from discord.ext import commands
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
+
+OPTIONS_PER_PAGE = 25  # Discord's select menu option limit
 
 
 # ---------- helpers ----------
@@ -28,6 +33,7 @@ def _cmd_desc(cmd: commands.Command) -> str:
     return d if d else "No description."
 
 
+@functools.lru_cache(maxsize=128)
 def _pick_emoji(name: str) -> str:
     n = name.lower()
     if "music" in n:
@@ -84,6 +90,17 @@ class BackButton(discord.ui.Button):
         await self.parent_view.show_home(interaction)
 
 
+class PageButton(discord.ui.Button):
+    def __init__(self, parent_view: "HelpView", step: int, row: int = 2):
+        label, emoji = ("Prev", "◀️") if step < 0 else ("Next", "▶️")
+        super().__init__(label=label, style=discord.ButtonStyle.secondary, emoji=emoji, row=row)
+        self.parent_view = parent_view
+        self.step = step
+
+    async def callback(self, interaction: discord.Interaction):
+        await self.parent_view.show_page(interaction, self.step)
+
+
 class HelpView(discord.ui.View):
     def __init__(self, cog: "Help", ctx: commands.Context, *, timeout: float = 180):
         super().__init__(timeout=timeout)
@@ -94,13 +111,35 @@ class HelpView(discord.ui.View):
 
         self.message: Optional[discord.Message] = None
         self._selected_cog: Optional[str] = None
-
-        self._build()
-
-    def _build(self) -> None:
-        self.clear_items()
-        self.add_item(CogSelect(self, self.cog._get_cog_options()))
-        self.add_item(CommandSelect(self, self.cog._get_command_options(limit=25)))
+        self._cmd_page: int = 0
+
+        # built once; interactions only swap their options
+        self._cog_select = CogSelect(self, self.cog._get_cog_options())
+        self._cmd_select = CommandSelect(self, self.cog._get_command_options())
+        self._back_button = BackButton(self, row=2)
+        self._prev_button = PageButton(self, -1, row=2)
+        self._next_button = PageButton(self, 1, row=2)
+        self.add_item(self._cog_select)
+        self.add_item(self._cmd_select)
+        self._sync_page_buttons()
+
+    def _sync_page_buttons(self) -> None:
+        pages = self.cog._command_page_count(self._selected_cog)
+        for button in (self._prev_button, self._next_button):
+            if pages <= 1:
+                if button in self.children:
+                    self.remove_item(button)
+            elif button not in self.children:
+                self.add_item(button)
+        self._prev_button.disabled = self._cmd_page <= 0
+        self._next_button.disabled = self._cmd_page >= pages - 1
+
+    def _set_selects(self, cog_name: Optional[str]) -> None:
+        self._cog_select.options = self.cog._get_cog_options(selected=cog_name)[:25]
+        self._cmd_select.options = self.cog._get_command_options(cog_name, self._cmd_page)
+        if self._back_button not in self.children:
+            self.add_item(self._back_button)
+        self._sync_page_buttons()
 
     async def show_home(self, interaction: discord.Interaction):
         emb = self.cog._home_embed()
@@ -108,29 +147,26 @@ class HelpView(discord.ui.View):
 
     async def show_cog(self, interaction: discord.Interaction, cog_name: str):
         self._selected_cog = cog_name
+        self._cmd_page = 0
         emb = self.cog._cog_embed(cog_name)
-
-        self.clear_items()
-        self.add_item(CogSelect(self, self.cog._get_cog_options(selected=cog_name)))
-        self.add_item(CommandSelect(self, self.cog._get_command_options(cog_name=cog_name)))
-        self.add_item(BackButton(self, row=2))
-
+        self._set_selects(cog_name)
         await interaction.response.edit_message(embed=emb, view=self)
 
     async def show_command(self, interaction: discord.Interaction, cmd_qualified: str):
         emb = self.cog._command_embed(cmd_qualified)
-
-        self.clear_items()
-        self.add_item(CogSelect(self, self.cog._get_cog_options(selected=self._selected_cog)))
-
-        if self._selected_cog:
-            self.add_item(CommandSelect(self, self.cog._get_command_options(cog_name=self._selected_cog)))
-        else:
-            self.add_item(CommandSelect(self, self.cog._get_command_options(limit=25)))
-
-        self.add_item(BackButton(self, row=2))
+        self._set_selects(self._selected_cog)
         await interaction.response.edit_message(embed=emb, view=self)
 
+    async def show_page(self, interaction: discord.Interaction, step: int):
+        pages = self.cog._command_page_count(self._selected_cog)
+        self._cmd_page = max(0, min(self._cmd_page + step, pages - 1))
+        self._cmd_select.options = self.cog._get_command_options(
+            self._selected_cog, self._cmd_page
+        )
+        self._sync_page_buttons()
+        # only the dropdown changes; keep whatever embed is showing
+        await interaction.response.edit_message(view=self)
+
     async def on_timeout(self) -> None:
         for item in self.children:
             if isinstance(item, (discord.ui.Button, discord.ui.Select)):
@@ -149,6 +185,20 @@ class Help(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+        # derived from the loaded cogs; dropped whenever that set changes
+        self._cache_sig: Tuple[int, ...] = ()
+        self._cogs_cache: Optional[List[Tuple[commands.Cog, str]]] = None
+        self._cog_options_cache: Dict[Optional[str], List[discord.SelectOption]] = {}
+        self._cmds_cache: Dict[Optional[str], List[commands.Command]] = {}
+        # keyed by (cog name, page)
+        self._cmd_options_cache: Dict[
+            Tuple[Optional[str], int], List[discord.SelectOption]
+        ] = {}
+        # lowercase name/alias -> canonical name, for case-insensitive !help lookups
+        self._cog_lower: Optional[Dict[str, str]] = None
+        self._cmd_lower: Optional[Dict[str, str]] = None
+        self._home_lines: Optional[List[str]] = None
+
     @commands.command(name="help")
     async def help(
         self,
@@ -170,46 +220,110 @@ class Help(commands.Cog):
             view.message = msg
             return
 
+        cog_lower, cmd_lower = self._name_index()
+        query = cog_or_command.lower()
+
         # fallback: command lookup
-        command = self.bot.get_command(cog_or_command)
-        if command:
-            return await ctx.send(embed=self._command_embed(command.qualified_name))
+        cmd_name = None
+        if subcommand:
+            cmd_name = cmd_lower.get(f"{query} {subcommand.lower()}")
+        cmd_name = cmd_name or cmd_lower.get(query)
+        if cmd_name:
+            return await ctx.send(embed=self._command_embed(cmd_name))
 
         # fallback: cog lookup
-        cog = self.bot.get_cog(cog_or_command.capitalize())
-        if cog:
-            return await ctx.send(embed=self._cog_embed(cog.qualified_name))
+        cog_name = cog_lower.get(query)
+        if cog_name:
+            return await ctx.send(embed=self._cog_embed(cog_name))
 
         await ctx.send(f"❌ No command or cog named `{cog_or_command}` found.")
 
     # -------- data builders --------
-    def _iter_cogs_with_commands(self) -> List[commands.Cog]:
-        out: List[commands.Cog] = []
+    def _sync_cache(self) -> None:
+        # discord.py has no cog add/remove event, so compare the loaded cog objects
+        # (a reloaded extension gets a new object under the same name) and the
+        # number of top-level commands
+        sig = tuple(map(id, self.bot.cogs.values())) + (len(self.bot.all_commands),)
+        if sig != self._cache_sig:
+            self._cache_sig = sig
+            self._cogs_cache = None
+            self._cog_options_cache.clear()
+            self._cmds_cache.clear()
+            self._cmd_options_cache.clear()
+            self._cog_lower = None
+            self._cmd_lower = None
+            self._home_lines = None
+
+    def _name_index(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        self._sync_cache()
+        if self._cog_lower is None or self._cmd_lower is None:
+            self._cog_lower = {name.lower(): name for name in self.bot.cogs}
+            cmd_lower: Dict[str, str] = {}
+            for cmd in self.bot.walk_commands():
+                parent = cmd.full_parent_name
+                for name in (cmd.name, *cmd.aliases):
+                    key = f"{parent} {name}" if parent else name
+                    cmd_lower.setdefault(key.lower(), cmd.qualified_name)
+            self._cmd_lower = cmd_lower
+        return self._cog_lower, self._cmd_lower
+
+    def _iter_cogs_with_commands(self) -> List[Tuple[commands.Cog, str]]:
+        """(cog, lowercased name) pairs, sorted by name."""
+        self._sync_cache()
+        if self._cogs_cache is not None:
+            return self._cogs_cache
+
+        out: List[Tuple[commands.Cog, str]] = []
         for c in self.bot.cogs.values():
             try:
                 if c.get_commands():
-                    out.append(c)
+                    out.append((c, c.qualified_name.lower()))
             except Exception:
                 continue
-        return sorted(out, key=lambda x: x.qualified_name.lower())
+        self._cogs_cache = sorted(out, key=lambda x: x[1])
+        return self._cogs_cache
 
     def _get_cog_options(self, selected: Optional[str] = None) -> List[discord.SelectOption]:
-        opts: List[discord.SelectOption] = []
-        for c in self._iter_cogs_with_commands():
+        self._sync_cache()
+        cached = self._cog_options_cache.get(selected)
+        if cached is not None:
+            return cached
+
+        if selected is not None:
+            # share the plain list; only the selected option gets its own copy
+            selected_lower = selected.lower()
+            opts = list(self._get_cog_options())
+            for i, (_, name_lower) in enumerate(self._iter_cogs_with_commands()):
+                if name_lower == selected_lower:
+                    opt = copy.copy(opts[i])
+                    opt.default = True
+                    opts[i] = opt
+                    break
+            self._cog_options_cache[selected] = opts
+            return opts
+
+        opts = []
+        for c, _ in self._iter_cogs_with_commands():
             opts.append(
                 discord.SelectOption(
                     label=c.qualified_name,
                     value=c.qualified_name,
                     description=_shorten(_cog_desc(c), 80),
                     emoji=_pick_emoji(c.qualified_name),
-                    default=(selected is not None and selected.lower() == c.qualified_name.lower()),
                 )
             )
         if not opts:
             opts.append(discord.SelectOption(label="No cogs found", value="none", default=True))
+        self._cog_options_cache[selected] = opts
         return opts
 
-    def _get_command_options(self, cog_name: Optional[str] = None, limit: int = 25) -> List[discord.SelectOption]:
+    def _get_commands(self, cog_name: Optional[str] = None) -> List[commands.Command]:
+        """Visible commands of one cog (or all cogs), sorted by name."""
+        self._sync_cache()
+        cached = self._cmds_cache.get(cog_name)
+        if cached is not None:
+            return cached
+
         cmds: List[commands.Command] = []
 
         if cog_name:
@@ -217,12 +331,26 @@ class Help(commands.Cog):
             if cog:
                 cmds = list(cog.get_commands())
         else:
-            for c in self._iter_cogs_with_commands():
+            for c, _ in self._iter_cogs_with_commands():
                 cmds.extend(list(c.get_commands()))
 
         cmds = [c for c in cmds if not c.hidden and c.enabled]
         cmds.sort(key=lambda x: x.qualified_name.lower())
-        cmds = cmds[:limit]
+        self._cmds_cache[cog_name] = cmds
+        return cmds
+
+    def _command_page_count(self, cog_name: Optional[str] = None) -> int:
+        n = len(self._get_commands(cog_name))
+        return max(1, -(-n // OPTIONS_PER_PAGE))
+
+    def _get_command_options(self, cog_name: Optional[str] = None, page: int = 0) -> List[discord.SelectOption]:
+        self._sync_cache()
+        cached = self._cmd_options_cache.get((cog_name, page))
+        if cached is not None:
+            return cached
+
+        start = page * OPTIONS_PER_PAGE
+        cmds = self._get_commands(cog_name)[start : start + OPTIONS_PER_PAGE]
 
         opts: List[discord.SelectOption] = []
         for cmd in cmds:
@@ -237,8 +365,18 @@ class Help(commands.Cog):
 
         if not opts:
             opts.append(discord.SelectOption(label="No commands found", value="none", default=True))
+        self._cmd_options_cache[(cog_name, page)] = opts
         return opts
 
+    def _get_home_lines(self) -> List[str]:
+        self._sync_cache()
+        if self._home_lines is None:
+            self._home_lines = [
+                f"{_pick_emoji(c.qualified_name)} **{c.qualified_name}** — {_shorten(_cog_desc(c), 60)}"
+                for c, _ in self._iter_cogs_with_commands()
+            ]
+        return self._home_lines
+
     # -------- embeds --------
     def _home_embed(self) -> discord.Embed:
         emb = discord.Embed(
@@ -248,15 +386,11 @@ class Help(commands.Cog):
             color=discord.Color.blurple(),
         )
 
-        cogs = self._iter_cogs_with_commands()
-        if not cogs:
+        lines = self._get_home_lines()
+        if not lines:
             emb.add_field(name="Nothing loaded", value="No loaded cogs with commands.", inline=False)
             return emb
 
-        lines = []
-        for c in cogs:
-            lines.append(f"{_pick_emoji(c.qualified_name)} **{c.qualified_name}** — {_shorten(_cog_desc(c), 60)}")
-
         emb.add_field(name="Categories", value="\n".join(lines[:12]), inline=False)
         if len(lines) > 12:
             emb.set_footer(text=f"+ {len(lines) - 12} more (use the dropdown).")
@@ -275,8 +409,7 @@ class Help(commands.Cog):
             color=discord.Color.green(),
         )
 
-        cmds = [c for c in cog.get_commands() if not c.hidden and c.enabled]
-        cmds.sort(key=lambda x: x.qualified_name.lower())
+        cmds = self._get_commands(cog.qualified_name)
 
         if not cmds:
             emb.add_field(name="Commands", value="(none)", inline=False)
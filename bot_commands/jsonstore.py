@@ -0,0 +1,47 @@
+"""JSON file helpers shared by the cogs that persist state (tempbans, tempmutes)."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any
+
+try:
+    import orjson  # optional: faster JSON load/save
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def load_json(path: str) -> Any:
+    """Parsed contents of `path`, or None if it's missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logging.exception(f"Failed to load {path}")
+        return None
+
+
+def save_json_atomic(path: str, obj: Any, fsync: bool = False) -> bool:
+    """Write `obj` to `path` compactly; returns False (and logs) on failure."""
+    # compact + atomic: write a temp file, then swap it in
+    tmp = path + ".tmp"
+    try:
+        if orjson is not None:
+            payload = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(obj, separators=(",", ":")).encode()
+        # whole payload in one unbuffered write
+        with open(tmp, "wb", buffering=0) as f:
+            f.write(payload)
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return True
+    except Exception:
+        logging.exception(f"Failed to save {path}")
+        return False
@@ -1,23 +1,46 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import discord
 from discord.ext import commands
 
+DM_TIMEOUT = 2.0  # seconds the kick waits on the courtesy DM
+
 
 class Kick(commands.Cog):
     """🥾 Kick members (with sanity checks)"""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # bot's own Member per guild, refreshed by the listeners below
+        self._me_cache: Dict[int, discord.Member] = {}
+
+    @commands.Cog.listener()
+    async def on_member_update(
+        self, before: discord.Member, after: discord.Member
+    ) -> None:
+        if self.bot.user is not None and after.id == self.bot.user.id:
+            self._me_cache[after.guild.id] = after
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self._me_cache.pop(guild.id, None)
 
     def _get_me_member(self, guild: discord.Guild) -> Optional[discord.Member]:
+        cached = self._me_cache.get(guild.id)
+        if cached is not None:
+            return cached
+
         # Pylance-safe way to get the bot's Member in the guild
         if self.bot.user is None:
             return None
-        return guild.me or guild.get_member(self.bot.user.id)
+        me = guild.me or guild.get_member(self.bot.user.id)
+        if me is not None:
+            self._me_cache[guild.id] = me
+        return me
 
     def _can_kick(
         self, ctx: commands.Context, member: discord.Member
@@ -77,11 +100,13 @@ class Kick(commands.Cog):
 
         kick_reason = reason or "No reason provided."
 
-        # Try DM (optional, fails silently)
-        try:
-            await member.send(f"You were kicked from **{ctx.guild.name}**. Reason: {kick_reason}")  # type: ignore[union-attr]
-        except Exception:
-            pass
+        # Try DM (optional, fails silently). It has to land before the kick (no
+        # shared server afterwards), but a slow DM shouldn't hold the kick up.
+        dm_task = asyncio.create_task(
+            member.send(f"You were kicked from **{ctx.guild.name}**. Reason: {kick_reason}")  # type: ignore[union-attr]
+        )
+        dm_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        await asyncio.wait({dm_task}, timeout=DM_TIMEOUT)
 
         try:
             await member.kick(reason=kick_reason)
@@ -3,36 +3,82 @@ from __future__ import annotations
 import os
 import re
 import asyncio
+import json
 import logging
+import random
 import shutil
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Tuple, cast, Any
+from itertools import islice
+from typing import Optional, List, Deque, Dict, Set, Tuple, Awaitable, Callable, cast, Any
 
+import aiohttp
 import discord
 from discord.ext import commands
 import yt_dlp
 
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
-
 
 # ===================== REGEX =====================
-SPOTIFY_TRACK_RE = re.compile(
-    r"(?:open\.spotify\.com/track/|spotify:track:)([A-Za-z0-9]+)"
+# one pass classifies track / album / playlist links and URIs
+SPOTIFY_RE = re.compile(
+    r"(?:open\.spotify\.com/(?P<kind>track|album|playlist)/"
+    r"|spotify:(?P<kind2>track|album|playlist):)(?P<id>[A-Za-z0-9]+)"
 )
-SPOTIFY_PLAYLIST_RE = re.compile(
-    r"(?:open\.spotify\.com/playlist/|spotify:playlist:)([A-Za-z0-9]+)"
+
+# plain prefix checks; a regex is overkill for "does this start with a YouTube host"
+_YT_HOSTS = (
+    "www.youtube.com/",
+    "youtube.com/",
+    "m.youtube.com/",
+    "music.youtube.com/",
+    "youtu.be/",
 )
-SPOTIFY_ALBUM_RE = re.compile(
-    r"(?:open\.spotify\.com/album/|spotify:album:)([A-Za-z0-9]+)"
+_YT_PREFIXES = tuple(
+    scheme + host for scheme in ("https://", "http://", "") for host in _YT_HOSTS
 )
 
-YOUTUBE_URL_RE = re.compile(
-    r"(https?://)?(www\.)?(youtube\.com|youtu\.be)/", re.IGNORECASE
+
+# ===================== FFMPEG =====================
+# reconnect on network blips instead of ending the track; -nostdin keeps
+# ffmpeg from reading the bot's stdin
+FFMPEG_BEFORE_OPTIONS = (
+    "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 -nostdin"
 )
 
 
+# ===================== LOOP MODES =====================
+_LOOP_NEXT = {"off": "one", "one": "all", "all": "off"}
+_LOOP_LABEL = {"off": "Off", "one": "One", "all": "All"}
+
+
+# ===================== PANEL =====================
+PANEL_REFRESH_INTERVAL = 5  # seconds between refresher ticks
+PANEL_PROGRESS_STEP = 3  # seconds of playback per progress bar update
+PANEL_DEBOUNCE = 0.5  # seconds; bursts of state changes collapse into one edit
+PANEL_ERROR_BACKOFF = 60  # seconds a guild is skipped after a failed refresh
+MAX_IDLE_STATES = 512  # idle guild states kept before the oldest are dropped
+
+
+# ===================== YT-DLP CACHE =====================
+YT_CACHE_FILE = "yt_meta_cache.json"
+YT_CACHE_MAX = 5000  # entries per cache, least recently used dropped first
+YT_STREAM_TTL = 4 * 3600  # seconds; YouTube stream URLs expire after ~6h
+YTDL_WORKERS = 4  # concurrent yt-dlp extractions
+
+SPOTIFY_API = "https://api.spotify.com/v1"
+SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
+SPOTIFY_PAGE_CONCURRENCY = 5  # parallel page requests per playlist/album load
+SPOTIFY_RETRIES = 3  # attempts per request when rate limited
+
+# (stream_url, title, duration, webpage_url, thumbnail)
+Resolved = Tuple[str, str, int, Optional[str], Optional[str]]
+# (title, duration, webpage_url, thumbnail)
+ResolvedMeta = Tuple[str, int, Optional[str], Optional[str]]
+
+
 # ===================== HELPERS =====================
 def fmt_duration(seconds: int) -> str:
     if not seconds or seconds < 0:
@@ -48,15 +94,25 @@ def clamp(n: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, n))
 
 
-def progress_bar(elapsed: int, total: int, width: int = 20) -> str:
+PROGRESS_WIDTH = 20
+# every possible bar at the default width, indexed by filled cells
+_BARS = tuple("█" * i + "░" * (PROGRESS_WIDTH - i) for i in range(PROGRESS_WIDTH + 1))
+
+
+def progress_bar(elapsed: int, total: int, width: int = PROGRESS_WIDTH) -> str:
     if total <= 0:
         return "—" * width
     frac = clamp(elapsed / total, 0.0, 1.0)
     filled = int(round(frac * width))
+    if width == PROGRESS_WIDTH:
+        return _BARS[filled]
     return "█" * filled + "░" * (width - filled)
 
 
 # ===================== DATA =====================
+# GuildState is only touched from the event loop, and no handler awaits
+# between reading the queue and acting on it (e.g. popleft -> current), so
+# those updates need no lock.
 @dataclass
 class Track:
     title: str
@@ -69,9 +125,9 @@ class Track:
 
 class GuildState:
     def __init__(self) -> None:
-        self.queue: List[Track] = []
+        # deque: tracks are taken from / pushed back onto the front
+        self.queue: Deque[Track] = deque()
         self.current: Optional[Track] = None
-        self.lock = asyncio.Lock()
 
         # Panel message (1 per guild)
         self.panel_channel_id: Optional[int] = None
@@ -80,8 +136,8 @@ class GuildState:
         # loop: "off" | "one" | "all"
         self.loop_mode: str = "off"
 
-        # audio volume multiplier
-        self.volume: float = 1.0
+        # audio volume multiplier; setting it also rebuilds ffmpeg_opts
+        self.volume = 1.0
 
         # when user skips, we don't requeue current even in loop modes
         self.skip_requested: bool = False
@@ -91,6 +147,119 @@ class GuildState:
         self.paused_at: Optional[float] = None  # monotonic timestamp when paused
         self.paused_total: float = 0.0  # total paused duration accumulated
 
+        # elapsed // PANEL_PROGRESS_STEP as last rendered on the panel
+        self.last_elapsed_shown: int = -1
+
+        # resolve of the next track, started while the current one plays
+        self.prefetch: Optional[asyncio.Task] = None
+        self.prefetch_query: Optional[str] = None
+
+        # rendered "Up Next" panel field; None when the queue changed since
+        self.upnext: Optional[str] = None
+
+        # panel view reused across refreshes; jump_sig is the queue head it shows
+        self.view: Optional[MusicControlsView] = None
+        self.jump_select: Optional[JumpSelect] = None
+        self.jump_sig: Tuple[str, ...] = ()
+
+    @property
+    def volume(self) -> float:
+        return self._volume
+
+    @volume.setter
+    def volume(self, value: float) -> None:
+        self._volume = float(value)
+        # per-state ffmpeg output options, rebuilt only when the volume changes
+        self.ffmpeg_opts = f"-vn -filter:a volume={max(0.05, self._volume)}"
+
+    def queue_changed(self) -> None:
+        # call after any queue mutation so the panel rebuilds "Up Next"
+        self.upnext = None
+
+    def cancel_prefetch(self) -> None:
+        if self.prefetch is not None:
+            self.prefetch.cancel()
+        self.prefetch = None
+        self.prefetch_query = None
+
+    def drop_view(self) -> None:
+        # timeout=None views stay in the bot's view store until stopped
+        if self.view is not None:
+            self.view.stop()
+        self.view = None
+        self.jump_select = None
+        self.jump_sig = ()
+
+
+# ===================== SPOTIFY =====================
+class SpotifyClient:
+    """Minimal async Spotify Web API client (client-credentials flow).
+
+    Covers only the endpoints the music cog uses, on one keep-alive session.
+    """
+
+    def __init__(self, client_id: str, client_secret: str) -> None:
+        self._auth = aiohttp.BasicAuth(client_id, client_secret)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._token: Optional[str] = None
+        self._token_expiry: float = 0.0
+        self._token_lock = asyncio.Lock()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _token_or_refresh(self) -> str:
+        async with self._token_lock:
+            if self._token is None or time.monotonic() >= self._token_expiry:
+                async with self._get_session().post(
+                    SPOTIFY_TOKEN_URL,
+                    data={"grant_type": "client_credentials"},
+                    auth=self._auth,
+                ) as r:
+                    if r.status != 200:
+                        raise RuntimeError(f"Spotify auth failed (HTTP {r.status})")
+                    body = await r.json()
+                self._token = str(body["access_token"])
+                # refresh a minute early
+                ttl = int(body.get("expires_in", 3600))
+                self._token_expiry = time.monotonic() + ttl - 60
+            return self._token
+
+    async def _get(self, path: str, **params: Any) -> Any:
+        for _ in range(SPOTIFY_RETRIES):
+            headers = {"Authorization": f"Bearer {await self._token_or_refresh()}"}
+            async with self._get_session().get(
+                f"{SPOTIFY_API}{path}", headers=headers, params=params
+            ) as r:
+                if r.status == 429:
+                    await asyncio.sleep(float(r.headers.get("Retry-After", "1")))
+                    continue
+                if r.status == 401:
+                    self._token = None  # expired early; fetch a new one
+                    continue
+                if r.status != 200:
+                    raise RuntimeError(f"Spotify API error (HTTP {r.status}) for {path}")
+                return await r.json()
+        raise RuntimeError(f"Spotify API gave up after {SPOTIFY_RETRIES} tries for {path}")
+
+    async def track(self, sid: str) -> Any:
+        return await self._get(f"/tracks/{sid}")
+
+    async def album(self, sid: str) -> Any:
+        return await self._get(f"/albums/{sid}")
+
+    async def album_tracks(self, sid: str, limit: int = 50, offset: int = 0) -> Any:
+        return await self._get(f"/albums/{sid}/tracks", limit=limit, offset=offset)
+
+    async def playlist_items(self, sid: str, limit: int = 100, offset: int = 0) -> Any:
+        return await self._get(f"/playlists/{sid}/tracks", limit=limit, offset=offset)
+
 
 # ===================== UI: MODALS =====================
 class VolumeModal(discord.ui.Modal, title="Set Volume"):
@@ -131,7 +300,7 @@ class VolumeModal(discord.ui.Modal, title="Set Volume"):
         await interaction.response.send_message(
             f"🔊 Volume set to **{int(pct)}%**", ephemeral=True
         )
-        await self.cog._refresh_panel(guild)
+        self.cog._schedule_refresh(guild)
 
 
 # ===================== UI: SELECTS =====================
@@ -164,15 +333,16 @@ class JumpSelect(discord.ui.Select):
                 "❌ Invalid selection.", ephemeral=True
             )
 
-        async with st.lock:
-            if idx < 0 or idx >= len(st.queue):
-                return await interaction.response.send_message(
-                    "❌ That track isn't in queue anymore.", ephemeral=True
-                )
+        if idx < 0 or idx >= len(st.queue):
+            return await interaction.response.send_message(
+                "❌ That track isn't in queue anymore.", ephemeral=True
+            )
 
-            # move selected to front (next)
-            chosen = st.queue.pop(idx)
-            st.queue.insert(0, chosen)
+        # move selected to front (next)
+        chosen = st.queue[idx]
+        del st.queue[idx]
+        st.queue.appendleft(chosen)
+        st.queue_changed()
 
         vc = guild.voice_client
         if vc and (
@@ -185,12 +355,12 @@ class JumpSelect(discord.ui.Select):
             await self.cog._play_next(guild)
 
         await interaction.response.send_message("⏭️ Jumped.", ephemeral=True)
-        await self.cog._refresh_panel(guild)
+        self.cog._schedule_refresh(guild)
 
 
 # ===================== UI: VIEW =====================
 class MusicControlsView(discord.ui.View):
-    def __init__(self, cog: "Music", guild_id: int, *, timeout: float = 900):
+    def __init__(self, cog: "Music", guild_id: int, *, timeout: Optional[float] = 900):
         super().__init__(timeout=timeout)
         self.cog = cog
         self.guild_id = guild_id
@@ -205,18 +375,17 @@ class MusicControlsView(discord.ui.View):
         if guild is None:
             return None, None, "This only works in a server."
 
-        vc_proto = guild.voice_client
-        if vc_proto is None:
+        vc = cast(Optional[discord.VoiceClient], guild.voice_client)
+        if vc is None:
             return guild, None, "I'm not in voice."
 
-        vc = cast(discord.VoiceClient, vc_proto)
-
-        user = interaction.user
-        member = user if isinstance(user, discord.Member) else None
-        if member is None or member.voice is None or member.voice.channel is None:
+        # only Members have .voice; duck-type instead of isinstance
+        voice = getattr(interaction.user, "voice", None)
+        user_channel = voice.channel if voice is not None else None
+        if user_channel is None:
             return guild, vc, "Join a voice channel first."
 
-        if vc.channel is not None and member.voice.channel.id != vc.channel.id:
+        if vc.channel is not None and user_channel.id != vc.channel.id:
             return guild, vc, "Be in *my* voice channel to control me."
 
         return guild, vc, None
@@ -248,7 +417,7 @@ class MusicControlsView(discord.ui.View):
         else:
             await self._ok(interaction, "Nothing is playing.")
 
-        await self.cog._refresh_panel(guild)
+        self.cog._schedule_refresh(guild)
 
     @discord.ui.button(
         label="Resume", style=discord.ButtonStyle.success, emoji="▶️", row=0
@@ -271,7 +440,7 @@ class MusicControlsView(discord.ui.View):
         else:
             await self._ok(interaction, "Nothing is paused.")
 
-        await self.cog._refresh_panel(guild)
+        self.cog._schedule_refresh(guild)
 
     @discord.ui.button(
         label="Skip", style=discord.ButtonStyle.primary, emoji="⏭️", row=0
@@ -285,6 +454,7 @@ class MusicControlsView(discord.ui.View):
 
         st = self.cog._state(guild.id)
         st.skip_requested = True
+        self.cog.dirty.add(guild.id)
 
         if vc.is_playing() or vc.is_paused():
             vc.stop()
@@ -301,19 +471,20 @@ class MusicControlsView(discord.ui.View):
             return await self._ok(interaction, f"❌ {err}")
 
         st = self.cog._state(guild.id)
-        async with st.lock:
-            st.queue.clear()
-            st.current = None
-            st.skip_requested = False
-            st.started_at = None
-            st.paused_at = None
-            st.paused_total = 0.0
+        st.queue.clear()
+        st.queue_changed()
+        st.current = None
+        st.cancel_prefetch()
+        st.skip_requested = False
+        st.started_at = None
+        st.paused_at = None
+        st.paused_total = 0.0
 
         if vc.is_playing() or vc.is_paused():
             vc.stop()
 
         await self._ok(interaction, "⏹️ Stopped.")
-        await self.cog._refresh_panel(guild)
+        self.cog._schedule_refresh(guild)
 
     @discord.ui.button(
         label="Leave", style=discord.ButtonStyle.danger, emoji="🚪", row=0
@@ -326,17 +497,18 @@ class MusicControlsView(discord.ui.View):
             return await self._ok(interaction, f"❌ {err}")
 
         st = self.cog._state(guild.id)
-        async with st.lock:
-            st.queue.clear()
-            st.current = None
-            st.skip_requested = False
-            st.started_at = None
-            st.paused_at = None
-            st.paused_total = 0.0
+        st.queue.clear()
+        st.queue_changed()
+        st.current = None
+        st.cancel_prefetch()
+        st.skip_requested = False
+        st.started_at = None
+        st.paused_at = None
+        st.paused_total = 0.0
 
         await vc.disconnect(force=True)
         await self._ok(interaction, "🚪 Left voice.")
-        await self.cog._refresh_panel(guild)
+        self.cog._schedule_refresh(guild)
 
     # ===== ROW 1 (max 5) =====
     @discord.ui.button(
@@ -350,10 +522,10 @@ class MusicControlsView(discord.ui.View):
             return await self._ok(interaction, "Server only.")
         st = self.cog._state(guild.id)
 
-        st.loop_mode = {"off": "one", "one": "all", "all": "off"}[st.loop_mode]
-        label = {"off": "Off", "one": "One", "all": "All"}[st.loop_mode]
+        st.loop_mode = _LOOP_NEXT[st.loop_mode]
+        label = _LOOP_LABEL[st.loop_mode]
         await self._ok(interaction, f"🔁 Loop: **{label}**")
-        await self.cog._refresh_panel(guild)
+        self.cog._schedule_refresh(guild)
 
     @discord.ui.button(
         label="Shuffle", style=discord.ButtonStyle.secondary, emoji="🔀", row=1
@@ -366,15 +538,17 @@ class MusicControlsView(discord.ui.View):
             return await self._ok(interaction, "Server only.")
         st = self.cog._state(guild.id)
 
-        async with st.lock:
-            if len(st.queue) < 2:
-                return await self._ok(interaction, "Queue too small.")
-            import random
-
-            random.shuffle(st.queue)
+        if len(st.queue) < 2:
+            return await self._ok(interaction, "Queue too small.")
+        # shuffle a list copy; indexing into a deque isn't O(1)
+        items = list(st.queue)
+        random.shuffle(items)
+        st.queue.clear()
+        st.queue.extend(items)
+        st.queue_changed()
 
         await self._ok(interaction, "🔀 Shuffled.")
-        await self.cog._refresh_panel(guild)
+        self.cog._schedule_refresh(guild)
 
     @discord.ui.button(
         label="Queue", style=discord.ButtonStyle.secondary, emoji="📜", row=1
@@ -414,7 +588,15 @@ class MusicControlsView(discord.ui.View):
 class Music(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.states: Dict[int, GuildState] = {}
+        # least recently used first, so idle guilds can be evicted from the front
+        self.states: "OrderedDict[int, GuildState]" = OrderedDict()
+        # guilds whose panel is stale; the refresher repaints only these
+        # (plus guilds whose progress bar moved)
+        self.dirty: Set[int] = set()
+        # guild id -> scheduled (debounced) panel repaint
+        self._refresh_pending: Dict[int, asyncio.Task] = {}
+        # guild id -> monotonic time until which the refresher skips it
+        self._panel_err_until: Dict[int, float] = {}
 
         ff = shutil.which("ffmpeg")
         if not ff:
@@ -432,33 +614,138 @@ class Music(commands.Cog):
             "default_search": "ytsearch",
         }
 
+        # yt-dlp runs on its own small pool; each worker thread builds one
+        # YoutubeDL (extractor setup is expensive) and reuses it
+        self._ydl_pool = ThreadPoolExecutor(
+            max_workers=YTDL_WORKERS, thread_name_prefix="ytdl"
+        )
+        self._ydl_local = threading.local()
+
+        # query -> resolve currently running for it
+        self._yt_inflight: Dict[str, "asyncio.Future[Resolved]"] = {}
+        # query -> (expires_at, resolved); stream URLs go stale, so these expire
+        self._yt_streams: "OrderedDict[str, Tuple[float, Resolved]]" = OrderedDict()
+        # query -> metadata; persisted so repeat searches skip straight to the video page
+        self._yt_meta: "OrderedDict[str, ResolvedMeta]" = self._load_yt_meta()
+
+        # in-flight reaction acks; held here so they aren't garbage collected mid-request
+        self._acks: Set["asyncio.Task[None]"] = set()
+
         # panel auto-refresh loop
         self._panel_task = self.bot.loop.create_task(self._panel_refresher())
 
     def cog_unload(self) -> None:
         if self._panel_task:
             self._panel_task.cancel()
+        for task in self._refresh_pending.values():
+            task.cancel()
+        for st in self.states.values():
+            st.drop_view()
+        self._ydl_pool.shutdown(wait=False, cancel_futures=True)
+        if self.sp is not None:
+            self.bot.loop.create_task(self.sp.close())
+        self._save_yt_meta()
+
+    def _load_yt_meta(self) -> "OrderedDict[str, ResolvedMeta]":
+        meta: "OrderedDict[str, ResolvedMeta]" = OrderedDict()
+        try:
+            with open(YT_CACHE_FILE, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return meta
+        except Exception:
+            logging.exception(f"Failed to load {YT_CACHE_FILE}")
+            return meta
+
+        if isinstance(raw, dict):
+            for key, v in raw.items():
+                if isinstance(v, list) and len(v) == 4:
+                    url = v[2] if isinstance(v[2], str) else None
+                    thumb = v[3] if isinstance(v[3], str) else None
+                    meta[key] = (str(v[0]), int(v[1] or 0), url, thumb)
+        return meta
+
+    def _save_yt_meta(self) -> None:
+        tmp = YT_CACHE_FILE + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._yt_meta, f)
+            os.replace(tmp, YT_CACHE_FILE)
+        except Exception:
+            logging.exception(f"Failed to save {YT_CACHE_FILE}")
 
     async def _panel_refresher(self) -> None:
         while True:
             try:
-                await asyncio.sleep(5)
-                for gid in list(self.states.keys()):
+                await asyncio.sleep(PANEL_REFRESH_INTERVAL)
+                self._evict_idle_states()
+                for gid, st in list(self.states.items()):
+                    if st.panel_message_id is None:
+                        continue
+                    if (
+                        gid not in self.dirty
+                        and self._compute_elapsed(st) // PANEL_PROGRESS_STEP
+                        == st.last_elapsed_shown
+                    ):
+                        continue
+                    if self._panel_err_until.get(gid, 0.0) > time.monotonic():
+                        continue  # backing off after an error
                     guild = self.bot.get_guild(gid)
                     if guild is None:
                         continue
-                    await self._refresh_panel(guild)
+                    try:
+                        await self._refresh_panel(guild)
+                    except Exception as e:
+                        # one bad guild shouldn't stall the others or log every tick
+                        self._panel_err_until[gid] = time.monotonic() + PANEL_ERROR_BACKOFF
+                        logging.warning(
+                            f"Panel refresh failed for guild {gid}: {e!r}",
+                            exc_info=logging.getLogger().isEnabledFor(logging.DEBUG),
+                        )
+                    else:
+                        self._panel_err_until.pop(gid, None)
             except asyncio.CancelledError:
                 return
             except Exception:
                 logging.exception("Panel refresher error")
 
+    @commands.Cog.listener()
+    async def on_voice_state_update(
+        self,
+        member: discord.Member,
+        before: discord.VoiceState,
+        after: discord.VoiceState,
+    ) -> None:
+        # the panel shows the bot's voice channel and status
+        if self.bot.user is not None and member.id == self.bot.user.id:
+            self.dirty.add(member.guild.id)
+
     def _state(self, guild_id: int) -> GuildState:
-        if guild_id not in self.states:
-            self.states[guild_id] = GuildState()
-        return self.states[guild_id]
+        st = self.states.get(guild_id)
+        if st is None:
+            st = self.states[guild_id] = GuildState()
+        else:
+            self.states.move_to_end(guild_id)
+        return st
 
-    def _init_spotify(self) -> Optional[spotipy.Spotify]:
+    def _evict_idle_states(self) -> None:
+        excess = len(self.states) - MAX_IDLE_STATES
+        if excess <= 0:
+            return
+        # oldest first; only guilds with nothing playing or queued and no posted
+        # panel (its buttons and loop/volume settings would go with the state)
+        for gid in [
+            gid
+            for gid, st in self.states.items()
+            if st.current is None and not st.queue and st.panel_message_id is None
+        ][:excess]:
+            st = self.states.pop(gid)
+            st.cancel_prefetch()
+            st.drop_view()
+            self.dirty.discard(gid)
+            self._panel_err_until.pop(gid, None)
+
+    def _init_spotify(self) -> Optional[SpotifyClient]:
         cid = os.getenv("SPOTIPY_CLIENT_ID")
         secret = os.getenv("SPOTIPY_CLIENT_SECRET")
         if not cid or not secret:
@@ -467,26 +754,23 @@ class Music(commands.Cog):
             )
             return None
         try:
-            auth = SpotifyClientCredentials(client_id=cid, client_secret=secret)
-            return spotipy.Spotify(auth_manager=auth)
+            return SpotifyClient(cid, secret)
         except Exception:
             logging.exception("Failed to init Spotify client.")
             return None
 
     def _spotify_kind_and_id(self, s: str) -> Tuple[Optional[str], Optional[str]]:
-        m = SPOTIFY_TRACK_RE.search(s)
-        if m:
-            return "track", m.group(1)
-        m = SPOTIFY_ALBUM_RE.search(s)
-        if m:
-            return "album", m.group(1)
-        m = SPOTIFY_PLAYLIST_RE.search(s)
-        if m:
-            return "playlist", m.group(1)
-        return None, None
+        # most queries are plain searches; both link forms contain "spotify:"
+        # or "spotify.com/", so skip the regex when neither can match
+        if "spotify" not in s:
+            return None, None
+        m = SPOTIFY_RE.search(s)
+        if m is None:
+            return None, None
+        return m.group("kind") or m.group("kind2"), m.group("id")
 
     def _is_youtube_url(self, s: str) -> bool:
-        return bool(YOUTUBE_URL_RE.search(s))
+        return s.lower().startswith(_YT_PREFIXES)
 
     def _voice_client(self, ctx: commands.Context) -> Optional[discord.VoiceClient]:
         vc = ctx.voice_client
@@ -498,13 +782,9 @@ class Music(commands.Cog):
     def _safe_artists(obj: Any) -> str:
         if not isinstance(obj, list):
             return ""
-        names: List[str] = []
-        for a in obj:
-            if isinstance(a, dict):
-                n = a.get("name")
-                if isinstance(n, str) and n.strip():
-                    names.append(n.strip())
-        return ", ".join(names).strip()
+        names = (a.get("name") for a in obj if isinstance(a, dict))
+        stripped = (n.strip() for n in names if isinstance(n, str))
+        return ", ".join(n for n in stripped if n)
 
     async def _ensure_voice(
         self, ctx: commands.Context
@@ -531,39 +811,118 @@ class Music(commands.Cog):
         except Exception:
             return None
 
-    async def _yt_resolve(
-        self, query_or_url: str
-    ) -> Tuple[str, str, int, Optional[str], Optional[str]]:
-        def work() -> Tuple[str, str, int, Optional[str], Optional[str]]:
-            ydl_opts_any = dict(self.ydl_opts)
+    @staticmethod
+    def _yt_key(query_or_url: str) -> str:
+        key = " ".join(query_or_url.split())
+        # search text is case-insensitive; video ids in URLs are not
+        return key.lower() if key.startswith("ytsearch") else key
+
+    async def _yt_resolve(self, query_or_url: str) -> Resolved:
+        key = self._yt_key(query_or_url)
+        hit = self._yt_streams.get(key)
+        if hit is not None:
+            if time.monotonic() < hit[0]:
+                self._yt_streams.move_to_end(key)
+                return hit[1]
+            del self._yt_streams[key]
+
+        # concurrent callers for the same query (e.g. the prefetch and
+        # _play_next) share one extraction
+        task = self._yt_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._yt_fetch(key, query_or_url))
+            self._yt_inflight[key] = task
+
+            def done(t: "asyncio.Future[Resolved]") -> None:
+                self._yt_inflight.pop(key, None)
+                if not t.cancelled():
+                    t.exception()  # mark retrieved even if every waiter left
+
+            task.add_done_callback(done)
+        # shielded so a cancelled waiter (a dropped prefetch) doesn't cancel it for others
+        return await asyncio.shield(task)
+
+    async def _yt_fetch(self, key: str, query_or_url: str) -> Resolved:
+        # a search we've resolved before can go straight to the video page
+        loop = asyncio.get_running_loop()
+        meta = self._yt_meta.get(key)
+        resolved: Optional[Resolved] = None
+        if meta is not None and meta[2]:
+            try:
+                resolved = await loop.run_in_executor(
+                    self._ydl_pool, self._yt_extract, meta[2]
+                )
+            except Exception:
+                self._yt_meta.pop(key, None)  # video gone; search again
+        if resolved is None:
+            resolved = await loop.run_in_executor(
+                self._ydl_pool, self._yt_extract, query_or_url
+            )
+
+        self._yt_streams[key] = (time.monotonic() + YT_STREAM_TTL, resolved)
+        self._yt_meta[key] = resolved[1:]
+        self._yt_meta.move_to_end(key)
+        for cache in (self._yt_streams, self._yt_meta):
+            while len(cache) > YT_CACHE_MAX:
+                cache.popitem(last=False)
+        return resolved
+
+    def _ydl(self) -> yt_dlp.YoutubeDL:
+        # YoutubeDL isn't safe to share between threads, so one per pool worker
+        ydl = getattr(self._ydl_local, "ydl", None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(dict(self.ydl_opts))
+            self._ydl_local.ydl = ydl
+        return ydl
+
+    def _yt_extract(self, query_or_url: str) -> Resolved:
+        info = self._ydl().extract_info(query_or_url, download=False)
 
-            with yt_dlp.YoutubeDL(ydl_opts_any) as ydl:
-                info = ydl.extract_info(query_or_url, download=False)
+        if isinstance(info, dict) and info.get("entries"):
+            entries = info.get("entries")
+            if isinstance(entries, list) and entries:
+                info = entries[0]
 
-                if isinstance(info, dict) and info.get("entries"):
-                    entries = info.get("entries")
-                    if isinstance(entries, list) and entries:
-                        info = entries[0]
+        if not isinstance(info, dict):
+            raise RuntimeError("yt-dlp returned unexpected result")
 
-                if not isinstance(info, dict):
-                    raise RuntimeError("yt-dlp returned unexpected result")
+        stream_url = info.get("url")
+        title = str(info.get("title") or "Unknown Title")
+        duration = int(info.get("duration") or 0)
 
-                stream_url = info.get("url")
-                title = str(info.get("title") or "Unknown Title")
-                duration = int(info.get("duration") or 0)
+        webpage = info.get("webpage_url") or info.get("original_url")
+        webpage_url = webpage if isinstance(webpage, str) else None
 
-                webpage = info.get("webpage_url") or info.get("original_url")
-                webpage_url = webpage if isinstance(webpage, str) else None
+        thumb = info.get("thumbnail")
+        thumbnail = thumb if isinstance(thumb, str) else None
 
-                thumb = info.get("thumbnail")
-                thumbnail = thumb if isinstance(thumb, str) else None
+        if not stream_url or not isinstance(stream_url, str):
+            raise RuntimeError("No stream URL found")
 
-                if not stream_url or not isinstance(stream_url, str):
-                    raise RuntimeError("No stream URL found")
+        return stream_url, title, duration, webpage_url, thumbnail
 
-                return stream_url, title, duration, webpage_url, thumbnail
+    async def _spotify_pages(
+        self, fetch: Callable[..., Awaitable[Any]], sid: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        """All pages of a paged Spotify endpoint, in order.
 
-        return await asyncio.to_thread(work)
+        The first page gives the total; the rest are fetched concurrently.
+        """
+        first = await fetch(sid, limit=limit, offset=0)
+        if not isinstance(first, dict):
+            return []
+        total = first.get("total")
+        if first.get("next") is None or not isinstance(total, int):
+            return [first]
+
+        sem = asyncio.Semaphore(SPOTIFY_PAGE_CONCURRENCY)
+
+        async def get(offset: int) -> Any:
+            async with sem:
+                return await fetch(sid, limit=limit, offset=offset)
+
+        rest = await asyncio.gather(*(get(o) for o in range(limit, total, limit)))
+        return [first, *(p for p in rest if isinstance(p, dict))]
 
     async def _spotify_tracks(self, url: str, requester_id: int) -> List[Track]:
         if self.sp is None:
@@ -578,7 +937,7 @@ class Music(commands.Cog):
         tracks: List[Track] = []
 
         if kind == "track":
-            t = await asyncio.to_thread(self.sp.track, sid)
+            t = await self.sp.track(sid)
             if not isinstance(t, dict):
                 raise RuntimeError("Spotify track response was not a dict")
 
@@ -601,7 +960,7 @@ class Music(commands.Cog):
             return tracks
 
         if kind == "album":
-            album = await asyncio.to_thread(self.sp.album, sid)
+            album = await self.sp.album(sid)
             if not isinstance(album, dict):
                 raise RuntimeError("Spotify album response was not a dict")
 
@@ -612,9 +971,11 @@ class Music(commands.Cog):
                 else "Album"
             )
 
-            page = await asyncio.to_thread(self.sp.album_tracks, sid, limit=50)
-            items_obj = page.get("items") if isinstance(page, dict) else []
-            items = items_obj if isinstance(items_obj, list) else []
+            items: List[Any] = []
+            for page in await self._spotify_pages(self.sp.album_tracks, sid, 50):
+                items_obj = page.get("items")
+                if isinstance(items_obj, list):
+                    items.extend(items_obj)
 
             for it in items:
                 if not isinstance(it, dict):
@@ -635,14 +996,7 @@ class Music(commands.Cog):
             return tracks
 
         # playlist
-        offset = 0
-        while True:
-            page = await asyncio.to_thread(
-                self.sp.playlist_items, sid, limit=100, offset=offset
-            )
-            if not isinstance(page, dict):
-                break
-
+        for page in await self._spotify_pages(self.sp.playlist_items, sid, 100):
             items_obj = page.get("items")
             items = items_obj if isinstance(items_obj, list) else []
 
@@ -666,19 +1020,16 @@ class Music(commands.Cog):
                     )
                 )
 
-            if page.get("next") is None:
-                break
-            offset += 100
-
         return tracks
 
     # ===================== PANEL BUILD =====================
     def _compute_elapsed(self, st: GuildState) -> int:
         if st.started_at is None:
             return 0
-        base = time.monotonic() - st.started_at - st.paused_total
+        now = time.monotonic()  # one sample so both terms agree
+        base = now - st.started_at - st.paused_total
         if st.paused_at is not None:
-            base -= time.monotonic() - st.paused_at
+            base -= now - st.paused_at
         return max(0, int(base))
 
     def _panel_embed(self, guild: discord.Guild, st: GuildState) -> discord.Embed:
@@ -697,7 +1048,7 @@ class Music(commands.Cog):
                 else:
                     playing_state = "⏹️ Idle"
 
-        loop_label = {"off": "Off", "one": "One", "all": "All"}[st.loop_mode]
+        loop_label = _LOOP_LABEL[st.loop_mode]
         vol_label = f"{int(st.volume * 100)}%"
 
         now_title = "—"
@@ -716,7 +1067,8 @@ class Music(commands.Cog):
                 requester = m.mention if m else f"`{st.current.requester_id}`"
 
         elapsed = self._compute_elapsed(st)
-        bar = progress_bar(elapsed, dur, width=20)
+        st.last_elapsed_shown = elapsed // PANEL_PROGRESS_STEP
+        bar = progress_bar(elapsed, dur)
         time_line = f"`{fmt_duration(elapsed)}` / `{fmt_duration(dur)}`"
 
         desc = f"**Voice:** `{channel_name}`\n**Status:** {playing_state}\n**Loop:** `{loop_label}`  •  **Volume:** `{vol_label}`\n\n"
@@ -736,15 +1088,18 @@ class Music(commands.Cog):
         emb.add_field(name="Requested by", value=f"👤 {requester}", inline=True)
         emb.add_field(name="Queue", value=f"📜 {len(st.queue)}", inline=True)
 
-        if st.queue:
-            lines: List[str] = []
-            for i, t in enumerate(st.queue[:5], start=1):
-                lines.append(f"`{i}.` {t.title}")
-            if len(st.queue) > 5:
-                lines.append(f"…and `{len(st.queue) - 5}` more")
-            emb.add_field(name="Up Next", value="\n".join(lines), inline=False)
-        else:
-            emb.add_field(name="Up Next", value="(empty)", inline=False)
+        if st.upnext is None:
+            if st.queue:
+                lines = [
+                    f"`{i}.` {t.title}"
+                    for i, t in enumerate(islice(st.queue, 5), start=1)
+                ]
+                if len(st.queue) > 5:
+                    lines.append(f"…and `{len(st.queue) - 5}` more")
+                st.upnext = "\n".join(lines)
+            else:
+                st.upnext = "(empty)"
+        emb.add_field(name="Up Next", value=st.upnext, inline=False)
 
         if thumb:
             emb.set_thumbnail(url=thumb)
@@ -762,7 +1117,7 @@ class Music(commands.Cog):
 
         if st.queue:
             lines: List[str] = []
-            for i, t in enumerate(st.queue[:10], start=1):
+            for i, t in enumerate(islice(st.queue, 10), start=1):
                 lines.append(f"`{i}.` {t.title}")
             if len(st.queue) > 10:
                 lines.append(f"…and `{len(st.queue) - 10}` more")
@@ -773,7 +1128,7 @@ class Music(commands.Cog):
 
     def _jump_options(self, st: GuildState) -> List[discord.SelectOption]:
         opts: List[discord.SelectOption] = []
-        for i, t in enumerate(st.queue[:25]):
+        for i, t in enumerate(islice(st.queue, 25)):
             label = t.title[:95] if t.title else "Unknown"
             opts.append(discord.SelectOption(label=label, value=str(i)))
         if not opts:
@@ -782,6 +1137,23 @@ class Music(commands.Cog):
             )
         return opts
 
+    def _panel_view(self, guild_id: int, st: GuildState) -> Tuple[MusicControlsView, bool]:
+        """The guild's panel view, and whether it changed since it was last sent."""
+        sig = tuple(t.title for t in islice(st.queue, 25))
+        if st.view is None or st.view.is_finished() or st.jump_select is None:
+            # no timeout: idle panels aren't repainted, so a timed-out view
+            # would leave dead buttons behind
+            st.view = MusicControlsView(self, guild_id, timeout=None)
+            # add jump select (own row)
+            st.jump_select = JumpSelect(self, guild_id, self._jump_options(st))
+            st.view.add_item(st.jump_select)
+        elif sig != st.jump_sig:
+            st.jump_select.options = self._jump_options(st)
+        else:
+            return st.view, False
+        st.jump_sig = sig
+        return st.view, True
+
     async def _ensure_panel(self, ctx: commands.Context) -> None:
         if ctx.guild is None:
             return
@@ -792,43 +1164,65 @@ class Music(commands.Cog):
         if not isinstance(channel, discord.TextChannel):
             return
 
-        view = MusicControlsView(self, ctx.guild.id)
-        # add jump select (own row)
-        view.add_item(JumpSelect(self, ctx.guild.id, self._jump_options(st)))
-
+        view, _ = self._panel_view(ctx.guild.id, st)
         emb = self._panel_embed(ctx.guild, st)
 
         if st.panel_message_id is not None:
+            # edit by id; no need to GET the message first
             try:
-                msg = await channel.fetch_message(st.panel_message_id)
-                await msg.edit(embed=emb, view=view)
+                await channel.get_partial_message(st.panel_message_id).edit(
+                    embed=emb, view=view
+                )
                 return
             except Exception:
                 st.panel_message_id = None
+                # the old message is gone; stop its view instead of leaving it registered
+                st.drop_view()
+                view, _ = self._panel_view(ctx.guild.id, st)
 
         msg = await channel.send(embed=emb, view=view)
         st.panel_message_id = msg.id
 
+    def _schedule_refresh(self, guild: discord.Guild) -> None:
+        # one edit per PANEL_DEBOUNCE window, however many changes land in it
+        if guild.id in self._refresh_pending:
+            return
+        self._refresh_pending[guild.id] = asyncio.create_task(
+            self._debounced_refresh(guild)
+        )
+
+    async def _debounced_refresh(self, guild: discord.Guild) -> None:
+        try:
+            await asyncio.sleep(PANEL_DEBOUNCE)
+        finally:
+            self._refresh_pending.pop(guild.id, None)
+        try:
+            await self._refresh_panel(guild)
+        except Exception:
+            logging.exception("Panel refresh failed")
+
     async def _refresh_panel(self, guild: discord.Guild) -> None:
         st = self._state(guild.id)
         if st.panel_channel_id is None or st.panel_message_id is None:
             return
 
+        self.dirty.discard(guild.id)
         ch = guild.get_channel(st.panel_channel_id)
         if not isinstance(ch, discord.TextChannel):
             return
 
-        try:
-            msg = await ch.fetch_message(st.panel_message_id)
-        except Exception:
-            return
-
-        view = MusicControlsView(self, guild.id)
-        view.add_item(JumpSelect(self, guild.id, self._jump_options(st)))
-
+        view, view_changed = self._panel_view(guild.id, st)
         emb = self._panel_embed(guild, st)
+        # edit by id; no need to GET the message first
+        msg = ch.get_partial_message(st.panel_message_id)
         try:
-            await msg.edit(embed=emb, view=view)
+            if view_changed:
+                await msg.edit(embed=emb, view=view)
+            else:
+                await msg.edit(embed=emb)  # components unchanged; smaller payload
+        except discord.NotFound:
+            st.panel_message_id = None  # panel was deleted
+            st.drop_view()
         except Exception:
             pass
 
@@ -836,64 +1230,67 @@ class Music(commands.Cog):
     async def _handle_track_end(self, guild: discord.Guild, finished: Track) -> None:
         st = self._state(guild.id)
 
-        async with st.lock:
-            skip = st.skip_requested
-            st.skip_requested = False
+        skip = st.skip_requested
+        st.skip_requested = False
 
-            if not skip:
-                if st.loop_mode == "one":
-                    st.queue.insert(0, finished)
-                elif st.loop_mode == "all":
-                    st.queue.append(finished)
+        if not skip:
+            if st.loop_mode == "one":
+                st.queue.appendleft(finished)
+                st.queue_changed()
+            elif st.loop_mode == "all":
+                st.queue.append(finished)
+                st.queue_changed()
 
-            if st.current is finished:
-                st.current = None
+        if st.current is finished:
+            st.current = None
 
-            st.started_at = None
-            st.paused_at = None
-            st.paused_total = 0.0
+        st.started_at = None
+        st.paused_at = None
+        st.paused_total = 0.0
 
-        await self._refresh_panel(guild)
+        self._schedule_refresh(guild)
         await self._play_next(guild)
 
     async def _play_next(self, guild: discord.Guild) -> None:
         st = self._state(guild.id)
+        # paths that bail out below leave the panel for the refresher
+        self.dirty.add(guild.id)
 
-        async with st.lock:
-            vc_proto = guild.voice_client
-            if vc_proto is None:
-                st.current = None
-                return
+        vc_proto = guild.voice_client
+        if vc_proto is None:
+            st.current = None
+            return
 
-            vc = cast(discord.VoiceClient, vc_proto)
-            if not vc.is_connected():
-                st.current = None
-                return
+        vc = cast(discord.VoiceClient, vc_proto)
+        if not vc.is_connected():
+            st.current = None
+            return
 
-            if vc.is_playing() or vc.is_paused():
-                return
+        if vc.is_playing() or vc.is_paused():
+            return
 
-            if not st.queue:
-                st.current = None
-                return
+        if not st.queue:
+            st.current = None
+            return
 
-            track = st.queue.pop(0)
-            st.current = track
+        track = st.queue.popleft()
+        st.queue_changed()
+        st.current = track
 
-        try:
-            src_query = track.query
-            if not (
-                src_query.startswith("ytsearch") or self._is_youtube_url(src_query)
-            ):
-                src_query = f"ytsearch1:{src_query}"
+        src_query = self._src_query(track)
+        prefetch = st.prefetch
+        if st.prefetch_query != src_query:
+            prefetch = None  # queue changed since it started; its result stays cached
+        st.prefetch = None
+        st.prefetch_query = None
 
+        try:
             stream_url, resolved_title, dur, webpage_url, thumb = (
-                await self._yt_resolve(src_query)
+                await (prefetch or self._yt_resolve(src_query))
             )
         except Exception as e:
             logging.warning(f"Failed to load track {track.title}: {e}")
-            async with st.lock:
-                st.current = None
+            st.current = None
             await self._play_next(guild)
             return
 
@@ -911,15 +1308,11 @@ class Music(commands.Cog):
         st.paused_at = None
         st.paused_total = 0.0
 
-        before_opts = "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5"
-        vol = max(0.05, float(st.volume))
-        opts = f"-vn -filter:a volume={vol}"
-
         source = discord.FFmpegPCMAudio(
             stream_url,
             executable=self.ffmpeg_path,
-            before_options=before_opts,
-            options=opts,
+            before_options=FFMPEG_BEFORE_OPTIONS,
+            options=st.ffmpeg_opts,
         )
 
         def after(err: Optional[Exception]) -> None:
@@ -930,7 +1323,37 @@ class Music(commands.Cog):
             )
 
         vc.play(source, after=after)
-        await self._refresh_panel(guild)
+        self._prefetch_next(st)
+        self._schedule_refresh(guild)
+
+    def _src_query(self, track: Track) -> str:
+        if track.query.startswith("ytsearch") or self._is_youtube_url(track.query):
+            return track.query
+        return f"ytsearch1:{track.query}"
+
+    def _prefetch_next(self, st: GuildState) -> None:
+        # resolve the next track while this one plays so there's no gap between songs
+        if not st.queue:
+            return
+        query = self._src_query(st.queue[0])
+        if query == st.prefetch_query:
+            return
+        st.cancel_prefetch()
+        st.prefetch = asyncio.create_task(self._yt_resolve(query))
+        st.prefetch.add_done_callback(lambda t: t.cancelled() or t.exception())
+        st.prefetch_query = query
+
+    def _ack(self, msg: discord.Message, emoji: str) -> None:
+        # reactions are cosmetic; don't hold the command up on the round-trip
+        task = asyncio.create_task(self._safe_react(msg, emoji))
+        self._acks.add(task)
+        task.add_done_callback(self._acks.discard)
+
+    async def _safe_react(self, msg: discord.Message, emoji: str) -> None:
+        try:
+            await msg.add_reaction(emoji)
+        except Exception:
+            pass
 
     # ===================== COMMANDS (NO SPAM) =====================
     @commands.command(name="controls")
@@ -938,10 +1361,7 @@ class Music(commands.Cog):
         if ctx.guild is None:
             return
         await self._ensure_panel(ctx)
-        try:
-            await ctx.message.add_reaction("✅")
-        except Exception:
-            pass
+        self._ack(ctx.message, "✅")
 
     @commands.command(name="play")
     async def play(self, ctx: commands.Context, *, query: Optional[str] = None):
@@ -951,20 +1371,14 @@ class Music(commands.Cog):
         await self._ensure_panel(ctx)
 
         if not query:
-            try:
-                await ctx.message.add_reaction("❓")
-            except Exception:
-                pass
+            self._ack(ctx.message, "❓")
             return
 
         query = query.strip()
 
         vc = await self._ensure_voice(ctx)
         if vc is None:
-            try:
-                await ctx.message.add_reaction("❌")
-            except Exception:
-                pass
+            self._ack(ctx.message, "❌")
             return
 
         st = self._state(ctx.guild.id)
@@ -978,8 +1392,8 @@ class Music(commands.Cog):
                 tracks = await self._spotify_tracks(
                     query, requester_id=requester_id or 0
                 )
-                async with st.lock:
-                    st.queue.extend(tracks)
+                st.queue.extend(tracks)
+                st.queue_changed()
             else:
                 if self._is_youtube_url(query):
                     t = Track(
@@ -991,21 +1405,15 @@ class Music(commands.Cog):
                         query=f"ytsearch1:{query}",
                         requester_id=requester_id,
                     )
-                async with st.lock:
-                    st.queue.append(t)
+                st.queue.append(t)
+                st.queue_changed()
 
-            try:
-                await ctx.message.add_reaction("✅")
-            except Exception:
-                pass
+            self._ack(ctx.message, "✅")
 
-            await self._refresh_panel(ctx.guild)
+            self._schedule_refresh(ctx.guild)
             await self._play_next(ctx.guild)
         except Exception:
-            try:
-                await ctx.message.add_reaction("❌")
-            except Exception:
-                pass
+            self._ack(ctx.message, "❌")
 
     @commands.command(name="skip")
     async def skip(self, ctx: commands.Context):
@@ -1019,47 +1427,46 @@ class Music(commands.Cog):
         ):
             st.skip_requested = True
             cast(discord.VoiceClient, vc).stop()
-            try:
-                await ctx.message.add_reaction("⏭️")
-            except Exception:
-                pass
+            self._ack(ctx.message, "⏭️")
 
     @commands.command(name="stop")
     async def stop(self, ctx: commands.Context):
         if ctx.guild is None:
             return
         st = self._state(ctx.guild.id)
-        async with st.lock:
-            st.queue.clear()
-            st.current = None
-            st.skip_requested = False
-            st.started_at = None
-            st.paused_at = None
-            st.paused_total = 0.0
+        st.queue.clear()
+        st.queue_changed()
+        st.current = None
+        st.cancel_prefetch()
+        st.skip_requested = False
+        st.started_at = None
+        st.paused_at = None
+        st.paused_total = 0.0
         vc = ctx.guild.voice_client
         if vc and (
             cast(discord.VoiceClient, vc).is_playing()
             or cast(discord.VoiceClient, vc).is_paused()
         ):
             cast(discord.VoiceClient, vc).stop()
-        await self._refresh_panel(ctx.guild)
+        self._schedule_refresh(ctx.guild)
 
     @commands.command(name="leave")
     async def leave(self, ctx: commands.Context):
         if ctx.guild is None:
             return
         st = self._state(ctx.guild.id)
-        async with st.lock:
-            st.queue.clear()
-            st.current = None
-            st.skip_requested = False
-            st.started_at = None
-            st.paused_at = None
-            st.paused_total = 0.0
+        st.queue.clear()
+        st.queue_changed()
+        st.current = None
+        st.cancel_prefetch()
+        st.skip_requested = False
+        st.started_at = None
+        st.paused_at = None
+        st.paused_total = 0.0
         vc = ctx.guild.voice_client
         if vc and cast(discord.VoiceClient, vc).is_connected():
             await cast(discord.VoiceClient, vc).disconnect(force=True)
-        await self._refresh_panel(ctx.guild)
+        self._schedule_refresh(ctx.guild)
 
 
 async def setup(bot: commands.Bot):
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-import json
-import os
+import asyncio
+import functools
+import heapq
+import re
 import time
 import logging
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
+
+from bot_commands.jsonstore import load_json, save_json_atomic
+
 
 DURATION_UNITS = {
     "s": 1,
@@ -17,35 +22,36 @@ DURATION_UNITS = {
     "w": 60 * 60 * 24 * 7,
 }
 
+# seconds before retrying unmutes whose guild was unavailable
+UNMUTE_RETRY = 20
+
+# parallel set_permissions calls when creating the Muted role
+OVERWRITE_CONCURRENCY = 10
+
+
+_DUR_RE = re.compile(r"^\s*(\d+)\s*([smhdw])\s*$", re.IGNORECASE | re.ASCII)
+
 
 def parse_duration(raw: str) -> Optional[int]:
     """
     Parse duration like: 30s, 10m, 2h, 3d, 1w
     Returns seconds or None if invalid.
     """
-    raw = raw.strip().lower()
-    if not raw:
-        return None
+    # normalize first so "10M" / " 10m " share one cache entry
+    return _parse_duration(raw.strip().lower())
 
-    num = ""
-    unit = ""
-    for ch in raw:
-        if ch.isdigit():
-            num += ch
-        else:
-            unit += ch
 
-    if not num or not unit or unit not in DURATION_UNITS:
+@functools.lru_cache(maxsize=256)
+def _parse_duration(raw: str) -> Optional[int]:
+    m = _DUR_RE.match(raw)
+    if not m:
         return None
 
-    try:
-        value = int(num)
-        if value <= 0:
-            return None
-    except ValueError:
+    value = int(m.group(1))
+    if value <= 0:
         return None
 
-    return value * DURATION_UNITS[unit]
+    return value * DURATION_UNITS[m.group(2)]
 
 
 class Mute(commands.Cog):
@@ -55,29 +61,36 @@ class Mute(commands.Cog):
         self.bot = bot
         self.data_file = "tempmutes.json"
         self.tempmutes: Dict[str, Dict[str, Dict[str, Any]]] = self._load()
-        self.unmute_task.start()
+        # min-heap of (unmute_at, guild_id, user_id); stale entries are skipped lazily
+        self._heap: List[Tuple[int, str, str]] = self._build_heap()
+        # set whenever the heap gets a new entry, so the scheduler re-checks its deadline
+        self._wakeup = asyncio.Event()
+        self._scheduler_task = self.bot.loop.create_task(self._scheduler())
 
     def cog_unload(self) -> None:
-        self.unmute_task.cancel()
+        self._scheduler_task.cancel()
 
     # ---------- persistence ----------
     def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, dict):
-                    return data
-            except Exception:
-                logging.exception("Failed to load tempmutes.json")
-        return {}
+        data = load_json(self.data_file)
+        return data if isinstance(data, dict) else {}
+
+    def _build_heap(self) -> List[Tuple[int, str, str]]:
+        heap: List[Tuple[int, str, str]] = []
+        for gkey, users in list(self.tempmutes.items()):
+            for ukey, entry in list(users.items()):
+                unmute_at = entry.get("unmute_at") if isinstance(entry, dict) else None
+                if not isinstance(unmute_at, int):
+                    users.pop(ukey, None)  # malformed; nothing to schedule
+                    continue
+                heap.append((unmute_at, gkey, ukey))
+            if not users:
+                self.tempmutes.pop(gkey, None)
+        heapq.heapify(heap)
+        return heap
 
     def _save(self) -> None:
-        try:
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(self.tempmutes, f, indent=2)
-        except Exception:
-            logging.exception("Failed to save tempmutes.json")
+        save_json_atomic(self.data_file, self.tempmutes)
 
     # ---------- utils ----------
     def _get_me_member(self, guild: discord.Guild) -> Optional[discord.Member]:
@@ -98,19 +111,24 @@ class Mute(commands.Cog):
             permissions=discord.Permissions.none(),
         )
 
-        # Apply overwrites to all channels
-        for channel in guild.channels:
-            try:
-                overwrite = channel.overwrites_for(role)
-                overwrite.send_messages = False
-                overwrite.add_reactions = False
-                overwrite.speak = False
-                overwrite.connect = False
-                overwrite.send_messages_in_threads = False
-                await channel.set_permissions(role, overwrite=overwrite)
-            except Exception:
-                # Don't die because one channel is weird
-                continue
+        # Apply overwrites to all channels (bounded, so we don't flood the rate limiter)
+        sem = asyncio.Semaphore(OVERWRITE_CONCURRENCY)
+
+        async def _apply(channel: discord.abc.GuildChannel) -> None:
+            overwrite = channel.overwrites_for(role)
+            overwrite.send_messages = False
+            overwrite.add_reactions = False
+            overwrite.speak = False
+            overwrite.connect = False
+            overwrite.send_messages_in_threads = False
+            async with sem:
+                try:
+                    await channel.set_permissions(role, overwrite=overwrite)
+                except Exception:
+                    # Don't die because one channel is weird
+                    pass
+
+        await asyncio.gather(*(_apply(c) for c in guild.channels))
 
         return role
 
@@ -157,9 +175,12 @@ class Mute(commands.Cog):
         ukey = str(user_id)
         self.tempmutes.setdefault(gkey, {})
         self.tempmutes[gkey][ukey] = {"unmute_at": unmute_at, "reason": reason}
+        heapq.heappush(self._heap, (unmute_at, gkey, ukey))
+        self._wakeup.set()
         self._save()
 
-    async def _clear_schedule(self, guild_id: int, user_id: int):
+    async def _clear_schedule(self, guild_id: int, user_id: int) -> bool:
+        # the heap entry goes stale and is skipped when it comes due
         gkey = str(guild_id)
         ukey = str(user_id)
         if gkey in self.tempmutes and ukey in self.tempmutes[gkey]:
@@ -167,49 +188,78 @@ class Mute(commands.Cog):
             if not self.tempmutes[gkey]:
                 self.tempmutes.pop(gkey, None)
             self._save()
+            return True
+        return False
 
     # ---------- background unmute ----------
-    @tasks.loop(seconds=20)
-    async def unmute_task(self):
+    async def _scheduler(self) -> None:
+        # sleeps until the soonest expiry (or a new mute) instead of polling
         await self.bot.wait_until_ready()
+        while True:
+            self._wakeup.clear()
+            try:
+                await self._unmute_due()
+            except Exception:
+                logging.exception("Auto-unmute pass failed")
+
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - time.time()
+            if delay <= 0:
+                # still due after a pass -> deferred, guild unavailable
+                delay = UNMUTE_RETRY
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
 
+    async def _unmute_due(self) -> None:
         now = int(time.time())
         changed = False
+        deferred: List[Tuple[int, str, str]] = []
+
+        # only entries that are due come off the heap
+        while self._heap and self._heap[0][0] <= now:
+            unmute_at, gkey, ukey = heapq.heappop(self._heap)
+
+            users = self.tempmutes.get(gkey)
+            if not users:
+                continue
+            entry = users.get(ukey)
+            if entry is None or entry.get("unmute_at") != unmute_at:
+                # cleared, or re-muted with a new expiry
+                continue
 
-        for guild_id, users in list(self.tempmutes.items()):
-            guild = self.bot.get_guild(int(guild_id))
+            guild = self.bot.get_guild(int(gkey))
             if guild is None:
+                # guild not available right now; retry on a later tick
+                deferred.append((unmute_at, gkey, ukey))
                 continue
 
             muted_role = discord.utils.get(guild.roles, name="Muted")
             if muted_role is None:
                 # role removed manually -> drop schedules
-                self.tempmutes.pop(guild_id, None)
+                self.tempmutes.pop(gkey, None)
                 changed = True
                 continue
 
-            for user_id, entry in list(users.items()):
-                unmute_at = entry.get("unmute_at")
-                if not isinstance(unmute_at, int):
-                    users.pop(user_id, None)
-                    changed = True
-                    continue
-
-                if now >= unmute_at:
-                    member = guild.get_member(int(user_id))
-                    # if they left, just clear schedule
-                    if member is not None:
-                        try:
-                            await member.remove_roles(muted_role, reason="Mute expired")
-                        except Exception:
-                            logging.exception("Failed to auto-unmute")
-
-                    users.pop(user_id, None)
-                    changed = True
+            member = guild.get_member(int(ukey))
+            # if they left, just clear schedule
+            if member is not None:
+                try:
+                    await member.remove_roles(muted_role, reason="Mute expired")
+                except Exception:
+                    logging.exception("Failed to auto-unmute")
 
+            users.pop(ukey, None)
             if not users:
-                self.tempmutes.pop(guild_id, None)
-                changed = True
+                self.tempmutes.pop(gkey, None)
+            changed = True
+
+        for item in deferred:
+            heapq.heappush(self._heap, item)
 
         if changed:
             self._save()
@@ -270,7 +320,7 @@ class Mute(commands.Cog):
             )
 
         # Already muted?
-        if muted_role in member.roles:
+        if member.get_role(muted_role.id) is not None:
             return await ctx.send(f"{member.mention} is already muted.")
 
         # Apply role
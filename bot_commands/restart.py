@@ -7,6 +7,9 @@ from typing import List
 
 from discord.ext import commands
 
+# resolved once at import, while the launch cwd still applies to a relative argv[0]
+_BOT_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
+
 
 class Restart(commands.Cog):
     """♻️ Restart / reload bot (owner only)"""
@@ -32,7 +35,8 @@ class Restart(commands.Cog):
             # Close cleanly, then replace the process
             await self.bot.close()
 
-            os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
+            # relative argv[0] and data files (tempbans.json, ...) assume this cwd
+            os.chdir(_BOT_DIR)
             os.execv(sys.executable, [sys.executable] + sys.argv)
 
         # ---------- Reload all currently loaded extensions ----------
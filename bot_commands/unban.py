@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-import json
-import os
-import logging
-from typing import Dict, Any, Optional
+import time
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union, cast
 
 import discord
 from discord.ext import commands
 
+from bot_commands.jsonstore import load_json, save_json_atomic
+
+
+if TYPE_CHECKING:
+    from bot_commands.ban import Ban
+
+# how long a guild's name -> user ban index is trusted without a ban/unban event
+BAN_INDEX_TTL = 300
+
 
 class Unban(commands.Cog):
     """🔓 Unban users (also clears temp-ban timers)"""
@@ -15,32 +22,35 @@ class Unban(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.data_file = "tempbans.json"
+        # only used while the Ban cog isn't loaded; otherwise its store is the source of truth
+        # same on-disk shape Ban writes: {guild_id: {user_id: [unban_at, reason]}}
+        self._data: Optional[Dict[str, Dict[str, List[Any]]]] = None
+        # guild_id -> (built_at, complete, {"name#discrim" / "name": user}), for name lookups;
+        # complete is False when the scan stopped early at a match
+        self._ban_index: Dict[int, Tuple[float, bool, Dict[str, discord.User]]] = {}
 
     # ---------- persistence ----------
-    def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, dict):
-                    return data
-            except Exception:
-                logging.exception("Failed to load tempbans.json")
-        return {}
-
-    def _save(self, data: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
-        try:
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-        except Exception:
-            logging.exception("Failed to save tempbans.json")
+    def _load(self) -> Dict[str, Dict[str, List[Any]]]:
+        data = load_json(self.data_file)
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, data: Dict[str, Dict[str, List[Any]]]) -> None:
+        save_json_atomic(self.data_file, data)
 
     def _clear_schedule(self, guild_id: int, user_id: int) -> bool:
         """
         Remove scheduled unban if present.
         Returns True if something was removed.
         """
-        data = self._load()
+        # Ban keeps tempbans in memory and writes them back itself, so edit its copy
+        ban_cog = cast(Optional["Ban"], self.bot.get_cog("Ban"))
+        if ban_cog is not None:
+            return ban_cog._clear_schedule(guild_id, user_id)
+
+        # nothing else writes the file then, so it's safe to load it once
+        if self._data is None:
+            self._data = self._load()
+        data = self._data
         gkey = str(guild_id)
         ukey = str(user_id)
 
@@ -52,6 +62,48 @@ class Unban(commands.Cog):
             return True
         return False
 
+    # ---------- ban index ----------
+    async def _find_banned(
+        self, guild: discord.Guild, name: str
+    ) -> Optional[discord.User]:
+        key = name.lower()
+        cached = self._ban_index.get(guild.id)
+        if cached is not None and time.monotonic() - cached[0] < BAN_INDEX_TTL:
+            _, complete, index = cached
+            hit = index.get(key)
+            # a miss only means "not banned" if the whole list was indexed
+            if hit is not None or complete:
+                return hit
+
+        # (re)scan from the top, stopping at the first match
+        index = {}
+        complete = True
+        match: Optional[discord.User] = None
+        async for entry in guild.bans(limit=2000):
+            banned_user = entry.user
+            tag = f"{banned_user.name}#{banned_user.discriminator}".lower()
+            plain = banned_user.name.lower()
+            # setdefault: first ban in list order wins, same as the old linear scan
+            index.setdefault(tag, banned_user)
+            index.setdefault(plain, banned_user)
+            if key == tag or key == plain:
+                match = banned_user
+                complete = False
+                break
+
+        self._ban_index[guild.id] = (time.monotonic(), complete, index)
+        return match
+
+    @commands.Cog.listener()
+    async def on_member_ban(
+        self, guild: discord.Guild, user: Union[discord.User, discord.Member]
+    ):
+        self._ban_index.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_unban(self, guild: discord.Guild, user: discord.User):
+        self._ban_index.pop(guild.id, None)
+
     # ---------- command ----------
     @commands.command(
         name="unban",
@@ -103,24 +155,14 @@ class Unban(commands.Cog):
             except discord.HTTPException as e:
                 return await ctx.send(f"❌ Discord API error: `{e}`")
 
-        # 2) Otherwise, search ban list for a matching name
+        # 2) Otherwise, look the name up in the (cached) ban list
         try:
-            bans = [entry async for entry in guild.bans(limit=2000)]
+            match = await self._find_banned(guild, user)
         except discord.Forbidden:
             return await ctx.send("❌ I can’t fetch ban list here (permissions).")
         except discord.HTTPException as e:
             return await ctx.send(f"❌ Discord API error: `{e}`")
 
-        user_lower = user.lower()
-        match: Optional[discord.User] = None
-
-        for entry in bans:
-            banned_user = entry.user
-            tag = f"{banned_user.name}#{banned_user.discriminator}".lower()
-            if user_lower == tag or user_lower == banned_user.name.lower():
-                match = banned_user
-                break
-
         if match is None:
             return await ctx.send(
                 "Couldn’t find that user in the ban list. Use a **user ID** for reliability."
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-import json
-import os
 import logging
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional, cast
 
 import discord
 from discord.ext import commands
 
+from bot_commands.jsonstore import load_json, save_json_atomic
+
+
+if TYPE_CHECKING:
+    from bot_commands.mute import Mute
+
 
 class Unmute(commands.Cog):
     """🔊 Unmute members (removes Muted role + cancels temp mute)"""
@@ -15,32 +19,31 @@ class Unmute(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.data_file = "tempmutes.json"
+        # only used while the Mute cog isn't loaded; otherwise its store is the source of truth
+        self._data: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
 
     # ---------- persistence helpers ----------
     def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, dict):
-                    return data
-            except Exception:
-                logging.exception("Failed to load tempmutes.json")
-        return {}
+        data = load_json(self.data_file)
+        return data if isinstance(data, dict) else {}
 
     def _save(self, data: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
-        try:
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-        except Exception:
-            logging.exception("Failed to save tempmutes.json")
+        save_json_atomic(self.data_file, data)
 
-    def _clear_schedule(self, guild_id: int, user_id: int) -> bool:
+    async def _clear_schedule(self, guild_id: int, user_id: int) -> bool:
         """
         Remove a user's scheduled unmute if present.
         Returns True if something was removed.
         """
-        data = self._load()
+        # Mute keeps tempmutes in memory and writes them back itself, so edit its copy
+        mute_cog = cast(Optional["Mute"], self.bot.get_cog("Mute"))
+        if mute_cog is not None:
+            return await mute_cog._clear_schedule(guild_id, user_id)
+
+        # nothing else writes the file then, so it's safe to load it once
+        if self._data is None:
+            self._data = self._load()
+        data = self._data
         gkey = str(guild_id)
         ukey = str(user_id)
 
@@ -85,9 +88,9 @@ class Unmute(commands.Cog):
         if muted_role is None:
             return await ctx.send("There is no **Muted** role in this server.")
 
-        if muted_role not in member.roles:
+        if member.get_role(muted_role.id) is None:
             # Still clear any schedule if it exists (clean-up)
-            removed = self._clear_schedule(guild.id, member.id)
+            removed = await self._clear_schedule(guild.id, member.id)
             if removed:
                 return await ctx.send(
                     f"{member.mention} isn’t muted anymore, but I cleared a leftover timer."
@@ -105,7 +108,7 @@ class Unmute(commands.Cog):
             return await ctx.send(f"❌ Failed to unmute: `{type(e).__name__}: {e}`")
 
         # cancel temp schedule if any
-        removed = self._clear_schedule(guild.id, member.id)
+        removed = await self._clear_schedule(guild.id, member.id)
 
         msg = f"✅ Unmuted {member.mention}. Reason: {unmute_reason}"
         if removed:
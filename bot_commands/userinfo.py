@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, List, Union
+from typing import Any, Optional, Dict, Set, Tuple, Union
 
 import discord
 from discord.ext import commands
@@ -9,6 +14,69 @@ from discord.ext import commands
 
 DiscordUserLike = Union[discord.User, discord.Member]
 
+# user id (snowflake) or <@id> / <@!id> mention
+_ID_RE = re.compile(r"^(?:<@!?)?(\d{17,20})>?$", re.ASCII)
+
+# banners only come with a REST fetch_user; remember them this long (seconds)
+BANNER_TTL = 3600
+
+# (channel id, user id) -> last message seen, filled from on_message
+LAST_MSG_CACHE_MAX = 10_000
+# messages to scan back through when the cache has nothing
+LAST_MSG_SCAN = 200
+
+LAST_MSG_FIELD = "🧾 Last Message (this channel)"
+
+# discord.Status -> "Online", "Idle", "Dnd", ...
+_STATUS_NAMES: Dict[discord.Status, str] = {st: st.name.title() for st in discord.Status}
+
+# (name, inline) for every userinfo field, in display order
+_EMBED_FIELDS = (
+    ("🆔 User ID", True),
+    ("🤖 Bot?", True),
+    ("🏅 Badges", False),
+    ("📅 Account Created", False),
+    ("🏠 Server Joined", False),
+    ("🏷️ Nickname", True),
+    ("👑 Top Role", True),
+    ("🎭 Roles", False),
+    ("🟢 Status", True),
+    ("🎮 Activity", True),
+    ("🔐 Key Permissions", False),
+    ("📜 All Granted Permissions", False),
+    ("🔊 Voice", False),
+    (LAST_MSG_FIELD, False),
+    ("💎 Boosting?", True),
+    ("💎 Boosting Since", False),
+    ("⏳ Timed Out Until", False),
+)
+_LAST_MSG_INDEX = [name for name, _ in _EMBED_FIELDS].index(LAST_MSG_FIELD)
+
+# role mentions listed before "… (+N more)"; keeps the field under Discord's 1024 chars
+MAX_ROLES_SHOWN = 25
+
+# (message id, preview text, sent at, jump url)
+LastMessage = Tuple[int, str, datetime, str]
+
+# (label, discord.Permissions attribute) shown under "Key Permissions"
+_KEY_PERMS = (
+    ("👑 Administrator", "administrator"),
+    ("🛠️ Manage Server", "manage_guild"),
+    ("🎭 Manage Roles", "manage_roles"),
+    ("🧱 Manage Channels", "manage_channels"),
+    ("🧹 Manage Messages", "manage_messages"),
+    ("🔨 Ban Members", "ban_members"),
+    ("🥾 Kick Members", "kick_members"),
+    ("🧑‍⚖️ Moderate Members", "moderate_members"),
+    ("📣 Mention Everyone", "mention_everyone"),
+    ("🪝 Manage Webhooks", "manage_webhooks"),
+)
+
+# permission attribute -> display name, e.g. "manage_guild" -> "Manage Guild"
+_PERM_PRETTY: Dict[str, str] = {
+    name: name.replace("_", " ").title() for name in discord.Permissions.VALID_FLAGS
+}
+
 
 def fmt_dt(dt: Optional[datetime]) -> str:
     if dt is None:
@@ -17,8 +85,26 @@ def fmt_dt(dt: Optional[datetime]) -> str:
     return f"<t:{ts}:F>  •  <t:{ts}:R>"
 
 
+_YESNO = ("❌ No", "✅ Yes")
+
+
 def yesno(v: bool) -> str:
-    return "✅ Yes" if v else "❌ No"
+    return _YESNO[bool(v)]
+
+
+@functools.lru_cache(maxsize=None)
+def flag_label(name: str) -> str:
+    # "hypesquad_bravery" -> "Hypesquad Bravery"; the set of flag names is small and fixed
+    return name.replace("_", " ").title()
+
+
+def _fmt_last(entry: LastMessage) -> str:
+    _, preview, created_at, jump_url = entry
+    return (
+        f"📝 {preview}\n"
+        f"🕒 {fmt_dt(created_at)}\n"
+        f"🔗 [Jump to message]({jump_url})"
+    )
 
 
 def shorten(text: str, max_len: int = 250) -> str:
@@ -29,25 +115,19 @@ def shorten(text: str, max_len: int = 250) -> str:
 
 
 def key_perms_summary(perms: discord.Permissions) -> str:
-    mapping = [
-        ("👑 Administrator", perms.administrator),
-        ("🛠️ Manage Server", perms.manage_guild),
-        ("🎭 Manage Roles", perms.manage_roles),
-        ("🧱 Manage Channels", perms.manage_channels),
-        ("🧹 Manage Messages", perms.manage_messages),
-        ("🔨 Ban Members", perms.ban_members),
-        ("🥾 Kick Members", perms.kick_members),
-        ("🧑‍⚖️ Moderate Members", perms.moderate_members),
-        ("📣 Mention Everyone", perms.mention_everyone),
-        ("🪝 Manage Webhooks", perms.manage_webhooks),
-    ]
-    out = [name for name, val in mapping if val]
+    if perms.administrator:
+        # implies everything else in the list
+        return "👑 Administrator"
+    out = [label for label, attr in _KEY_PERMS if getattr(perms, attr)]
     return ", ".join(out) if out else "-"
 
 
 def all_true_perms(perms: discord.Permissions) -> str:
-    granted = [name.replace("_", " ").title() for name, val in perms if val]
-    return ", ".join(granted) if granted else "-"
+    if perms.administrator:
+        # guild_permissions reports every flag as set for admins; listing them
+        # all only to be cut off at 900 chars says nothing useful
+        return "(Administrator — all permissions)"
+    return ", ".join(_PERM_PRETTY[name] for name, val in perms if val) or "-"
 
 
 class UserInfo(commands.Cog):
@@ -55,6 +135,103 @@ class UserInfo(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # user id -> (fetched_at, banner url or None)
+        self._banners: Dict[int, Tuple[float, Optional[str]]] = {}
+        self._last_msg: "OrderedDict[Tuple[int, int], LastMessage]" = OrderedDict()
+        # constant part of the userinfo embed; each call copies it and fills in values
+        self._embed_skel: Dict[str, Any] = {
+            "color": discord.Color.blurple().value,
+            "fields": [
+                {"name": name, "value": "", "inline": inline}
+                for name, inline in _EMBED_FIELDS
+            ],
+        }
+        # background last-message scans; held so they aren't garbage collected
+        self._fills: Set["asyncio.Task[None]"] = set()
+
+    def _remember(self, msg: discord.Message) -> LastMessage:
+        content = msg.content or ""
+        if not content and msg.attachments:
+            content = f"[{len(msg.attachments)} attachment(s)]"
+        elif not content and msg.embeds:
+            content = f"[{len(msg.embeds)} embed(s)]"
+        if not content:
+            content = "[empty message]"
+
+        entry = (msg.id, shorten(content), msg.created_at, msg.jump_url)
+        key = (msg.channel.id, msg.author.id)
+        self._last_msg[key] = entry
+        self._last_msg.move_to_end(key)
+        if len(self._last_msg) > LAST_MSG_CACHE_MAX:
+            self._last_msg.popitem(last=False)
+        return entry
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.guild is not None:
+            self._remember(message)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        msg = payload.cached_message
+        if msg is None:
+            return
+        key = (payload.channel_id, msg.author.id)
+        entry = self._last_msg.get(key)
+        if entry is not None and entry[0] == payload.message_id:
+            # don't point at a deleted message; the next lookup rescans
+            del self._last_msg[key]
+
+    async def _get_banner(self, user: DiscordUserLike) -> Optional[str]:
+        banner = getattr(user, "banner", None)
+        if banner:
+            return banner.url
+
+        now = time.monotonic()
+        cached = self._banners.get(user.id)
+        if cached is not None:
+            if now - cached[0] < BANNER_TTL:
+                return cached[1]
+            del self._banners[user.id]
+
+        try:
+            fetched = await self.bot.fetch_user(user.id)
+        except Exception:
+            return None
+        url = fetched.banner.url if fetched.banner else None
+        self._banners[user.id] = (now, url)
+        return url
+
+    def _cached_last_message(self, channel_id: int, user_id: int) -> Optional[str]:
+        """Last-message field text if it's known without a history scan, else None."""
+        entry = self._last_msg.get((channel_id, user_id))
+        return _fmt_last(entry) if entry is not None else None
+
+    async def _scan_last_message(
+        self, channel: Union[discord.TextChannel, discord.Thread], user_id: int
+    ) -> str:
+        async for msg in channel.history(limit=LAST_MSG_SCAN):
+            if msg.author.id == user_id:
+                return _fmt_last(self._remember(msg))
+        return "-"
+
+    async def _fill_last_message(
+        self,
+        sent: discord.Message,
+        embed: discord.Embed,
+        index: int,
+        channel: Union[discord.TextChannel, discord.Thread],
+        user_id: int,
+    ) -> None:
+        try:
+            value = await self._scan_last_message(channel, user_id)
+        except Exception:
+            value = "-"
+        embed.set_field_at(index, name=LAST_MSG_FIELD, value=value, inline=False)
+        try:
+            await sent.edit(embed=embed)
+        except Exception:
+            pass
 
     @commands.command(
         name="userinfo",
@@ -71,23 +248,17 @@ class UserInfo(commands.Cog):
         member: Optional[discord.Member] = None
         user: Optional[DiscordUserLike] = None
 
-        # 1) Mention
-        if ctx.message.mentions:
-            mentioned = ctx.message.mentions[0]
-            if isinstance(mentioned, discord.Member):
-                member = mentioned
-                user = mentioned
-            else:
-                # It's a User mention (rare in guild context, but type-safe)
-                user = mentioned
-
-        # 2) ID
-        elif target and target.isdigit():
-            uid = int(target)
+        # 1) ID, or a mention typed/pasted as text
+        id_match = _ID_RE.match(target) if target else None
+        if id_match:
+            uid = int(id_match.group(1))
             member = guild.get_member(uid)
             if member is not None:
                 user = member
             else:
+                # seen in another guild? then no REST call needed
+                user = self.bot.get_user(uid)
+            if user is None:
                 try:
                     fetched_user = await self.bot.fetch_user(uid)
                     user = fetched_user
@@ -96,7 +267,25 @@ class UserInfo(commands.Cog):
                 except discord.HTTPException as e:
                     return await ctx.send(f"❌ Discord API error: `{e}`")
 
-        # 3) Default to author
+        # 2) Mention
+        elif ctx.message.mentions:
+            mentioned = ctx.message.mentions[0]
+            if isinstance(mentioned, discord.Member):
+                member = mentioned
+                user = mentioned
+            else:
+                # It's a User mention (rare in guild context, but type-safe)
+                user = mentioned
+
+        # 3) Something was given but it's neither: say so, don't show the author
+        elif target:
+            if target.isdigit():
+                return await ctx.send("❌ No user found with that ID.")
+            return await ctx.send(
+                "❌ Couldn't resolve that user. Use a mention or user ID."
+            )
+
+        # 4) Default to author
         else:
             if isinstance(ctx.author, discord.Member):
                 member = ctx.author
@@ -112,22 +301,26 @@ class UserInfo(commands.Cog):
         avatar_url = user.display_avatar.url
 
         # banner (optional)
-        banner_url: Optional[str] = None
-        try:
-            fetched = await self.bot.fetch_user(user.id)
-            if fetched.banner:
-                banner_url = fetched.banner.url
-        except Exception:
-            pass
+        banner_url = await self._get_banner(user)
+
+        # last message in THIS channel (members only); a cache miss means a
+        # history scan, which is filled in after the embed is already out
+        last_msg_str = "-"
+        scan_channel: Optional[Union[discord.TextChannel, discord.Thread]] = None
+        channel = ctx.channel
+        if member is not None and isinstance(
+            channel, (discord.TextChannel, discord.Thread)
+        ):
+            cached_last = self._cached_last_message(channel.id, user.id)
+            if cached_last is None:
+                last_msg_str = "⏳ Searching…"
+                scan_channel = channel
+            else:
+                last_msg_str = cached_last
 
         # badges (public flags)
-        flags = getattr(user, "public_flags", None)
-        badge_list: List[str] = []
-        if flags:
-            for name, val in flags:
-                if val:
-                    badge_list.append(name.replace("_", " ").title())
-        badges = ", ".join(badge_list) if badge_list else "-"
+        flags = getattr(user, "public_flags", None) or ()
+        badges = ", ".join(flag_label(name) for name, val in flags if val) or "-"
 
         # ---------- Server-only defaults ----------
         joined_at = "-"
@@ -137,7 +330,6 @@ class UserInfo(commands.Cog):
         perms_key = "-"
         perms_all = "-"
         voice_str = "-"
-        last_msg_str = "-"
         status = "-"
         activity = "-"
         boosting = "-"
@@ -150,56 +342,41 @@ class UserInfo(commands.Cog):
             nick = member.nick or "-"
             top_role = member.top_role.mention if member.top_role else "-"
 
-            roles = [r.mention for r in member.roles if r.name != "@everyone"]
-            roles_str = ", ".join(roles) if roles else "-"
+            # roles[0] is always @everyone
+            roles = member.roles[1:]
+            if len(roles) > MAX_ROLES_SHOWN:
+                roles_str = (
+                    ", ".join(r.mention for r in roles[:MAX_ROLES_SHOWN])
+                    + f" … (+{len(roles) - MAX_ROLES_SHOWN} more)"
+                )
+            else:
+                roles_str = ", ".join(r.mention for r in roles) or "-"
 
             perms = member.guild_permissions
             perms_key = key_perms_summary(perms)
             perms_all = all_true_perms(perms)
 
             # voice
-            if member.voice and member.voice.channel:
-                vc = member.voice.channel
+            voice = member.voice
+            if voice and voice.channel:
+                vc = voice.channel
                 vc_name = getattr(vc, "name", "Voice")
                 voice_str = (
                     f"🔊 **{vc_name}**\n"
-                    f"🎙️ Self Mute: {yesno(bool(member.voice.self_mute))}\n"
-                    f"🎧 Self Deaf: {yesno(bool(member.voice.self_deaf))}\n"
-                    f"🔇 Server Mute: {yesno(bool(member.voice.mute))}\n"
-                    f"🙉 Server Deaf: {yesno(bool(member.voice.deaf))}"
+                    f"🎙️ Self Mute: {_YESNO[bool(voice.self_mute)]}\n"
+                    f"🎧 Self Deaf: {_YESNO[bool(voice.self_deaf)]}\n"
+                    f"🔇 Server Mute: {_YESNO[bool(voice.mute)]}\n"
+                    f"🙉 Server Deaf: {_YESNO[bool(voice.deaf)]}"
                 )
             else:
                 voice_str = "-"
 
-            # last message in THIS channel
-            try:
-                if isinstance(ctx.channel, (discord.TextChannel, discord.Thread)):
-                    async for msg in ctx.channel.history(limit=200):
-                        if msg.author.id == user.id:
-                            content = msg.content or ""
-                            if not content and msg.attachments:
-                                content = f"[{len(msg.attachments)} attachment(s)]"
-                            elif not content and msg.embeds:
-                                content = f"[{len(msg.embeds)} embed(s)]"
-                            if not content:
-                                content = "[empty message]"
-
-                            last_msg_str = (
-                                f"📝 {shorten(content)}\n"
-                                f"🕒 {fmt_dt(msg.created_at)}\n"
-                                f"🔗 [Jump to message]({msg.jump_url})"
-                            )
-                            break
-            except Exception:
-                last_msg_str = "-"
-
             # presence
-            status = str(getattr(member, "status", "unknown")).title()
-            if member.activities:
-                for a in member.activities:
-                    if a and getattr(a, "name", None):
-                        activity = a.name
-                        break
+            status = _STATUS_NAMES.get(member.status, "Unknown")
+            activity = next(
+                (a.name for a in member.activities if a and getattr(a, "name", None)),
+                "-",
+            )
 
             boosting = yesno(member.premium_since is not None)
             boosting_since = (
@@ -210,50 +387,48 @@ class UserInfo(commands.Cog):
             )
 
         # ---------- Embed ----------
-        embed = discord.Embed(
-            title=f"👤 User Info — {user}",
-            description=f"✨ Display Name: **{user.display_name}**",
-            color=discord.Color.blurple(),
-        )
-        embed.set_thumbnail(url=avatar_url)
-
-        embed.add_field(name="🆔 User ID", value=str(user.id), inline=True)
-        embed.add_field(
-            name="🤖 Bot?", value=yesno(bool(getattr(user, "bot", False))), inline=True
-        )
-        embed.add_field(name="🏅 Badges", value=badges, inline=False)
-
-        embed.add_field(name="📅 Account Created", value=created_at, inline=False)
-        embed.add_field(name="🏠 Server Joined", value=joined_at, inline=False)
-
-        embed.add_field(name="🏷️ Nickname", value=nick, inline=True)
-        embed.add_field(name="👑 Top Role", value=top_role, inline=True)
-
-        embed.add_field(name="🎭 Roles", value=roles_str, inline=False)
-
-        embed.add_field(name="🟢 Status", value=status, inline=True)
-        embed.add_field(name="🎮 Activity", value=activity, inline=True)
-
-        embed.add_field(name="🔐 Key Permissions", value=perms_key, inline=False)
-        embed.add_field(
-            name="📜 All Granted Permissions",
-            value=shorten(perms_all, 900),
-            inline=False,
-        )
-
-        embed.add_field(name="🔊 Voice", value=voice_str, inline=False)
-        embed.add_field(
-            name="🧾 Last Message (this channel)", value=last_msg_str, inline=False
+        # values in _EMBED_FIELDS order; names/inline flags come from the skeleton
+        values = (
+            str(user.id),
+            yesno(bool(getattr(user, "bot", False))),
+            badges,
+            created_at,
+            joined_at,
+            nick,
+            top_role,
+            roles_str,
+            status,
+            activity,
+            perms_key,
+            shorten(perms_all, 900),
+            voice_str,
+            last_msg_str,
+            boosting,
+            boosting_since,
+            timed_out_until,
         )
-
-        embed.add_field(name="💎 Boosting?", value=boosting, inline=True)
-        embed.add_field(name="💎 Boosting Since", value=boosting_since, inline=False)
-        embed.add_field(name="⏳ Timed Out Until", value=timed_out_until, inline=False)
-
+        skel = self._embed_skel
+        data: Dict[str, Any] = {
+            **skel,
+            "title": f"👤 User Info — {user}",
+            "description": f"✨ Display Name: **{user.display_name}**",
+            "thumbnail": {"url": avatar_url},
+            "fields": [{**f, "value": v} for f, v in zip(skel["fields"], values)],
+        }
         if banner_url:
-            embed.set_image(url=banner_url)
+            data["image"] = {"url": banner_url}
+        embed = discord.Embed.from_dict(data)
+
+        sent = await ctx.send(embed=embed)
 
-        await ctx.send(embed=embed)
+        if scan_channel is not None:
+            task = asyncio.create_task(
+                self._fill_last_message(
+                    sent, embed, _LAST_MSG_INDEX, scan_channel, user.id
+                )
+            )
+            self._fills.add(task)
+            task.add_done_callback(self._fills.discard)
 
 
 async def setup(bot: commands.Bot):
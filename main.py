@@ -1,3 +1,4 @@
+import asyncio
 import os
 import logging
 import discord
@@ -10,6 +11,12 @@ PREFIX = "!"
 INTENTS = discord.Intents.default()
 INTENTS.message_content = True
 INTENTS.members = True
+# presences stay off (Intents.default() leaves them out): no per-presence gateway
+# work, at the cost of userinfo's status/activity reading as offline/none
+
+# cache only what the cogs read: members (get_member in mute/userinfo) and voice
+# states (music). Guilds are still chunked at startup so those lookups find everyone.
+MEMBER_CACHE = discord.MemberCacheFlags(joined=True, voice=True)
 
 logging.basicConfig(level=logging.INFO)
 
@@ -39,48 +46,56 @@ EXTENSIONS = [
 
 class MyBot(commands.Bot):
     async def setup_hook(self):
-        for ext in EXTENSIONS:
-            try:
-                await self.load_extension(ext)
-                logging.info(f"Loaded: {ext}")
-            except Exception as e:
-                logging.exception(f"Failed to load {ext}: {e}")
-
-
-bot = MyBot(command_prefix=PREFIX, intents=INTENTS)
-
-
-@bot.event
-async def on_ready():
-    print("woot is online🌳🎵")
-
-    user = bot.user
-    if user is None:
-        # Super rare, but satisfies type-checkers like Pylance
-        logging.info("Logged in (bot user not available yet).")
-        return
-
-    logging.info(f"Logged in as {user} (ID: {user.id})")
-
-
-@bot.event
-async def on_command_error(ctx: commands.Context, error: commands.CommandError):
-    if isinstance(error, commands.CommandNotFound):
-        return
-    if isinstance(error, commands.MissingPermissions):
-        return await ctx.send("You don’t have permission for that.")
-    if isinstance(error, commands.BotMissingPermissions):
-        return await ctx.send("I’m missing permissions to carry out this action.")
-    if isinstance(error, commands.MissingRequiredArgument):
-        return await ctx.send(f"Missing argument: `{error.param.name}`")
-    if isinstance(error, commands.BadArgument):
-        return await ctx.send("Wrong Argument, Not found.")
-
-    logging.exception("Unhandled error:", exc_info=error)
-    await ctx.send(f"❌ `{type(error).__name__}`")
-
-
-if not TOKEN:
-    raise RuntimeError("DISCORD_TOKEN environment variable is not set.")
-
-bot.run(TOKEN)
+        # extensions don't depend on each other, so load them side by side
+        await asyncio.gather(*(self._safe_load(ext) for ext in EXTENSIONS))
+
+    async def _safe_load(self, ext: str):
+        try:
+            await self.load_extension(ext)
+            logging.info(f"Loaded: {ext}")
+        except Exception as e:
+            logging.exception(f"Failed to load {ext}: {e}")
+
+
+def main():
+    # everything that needs a live client lives here, so importing this module is cheap
+    if not TOKEN:
+        raise RuntimeError("DISCORD_TOKEN environment variable is not set.")
+
+    bot = MyBot(
+        command_prefix=PREFIX, intents=INTENTS, member_cache_flags=MEMBER_CACHE
+    )
+
+    @bot.event
+    async def on_ready():
+        print("woot is online🌳🎵")
+
+        user = bot.user
+        if user is None:
+            # Super rare, but satisfies type-checkers like Pylance
+            logging.info("Logged in (bot user not available yet).")
+            return
+
+        logging.info(f"Logged in as {user} (ID: {user.id})")
+
+    @bot.event
+    async def on_command_error(ctx: commands.Context, error: commands.CommandError):
+        if isinstance(error, commands.CommandNotFound):
+            return
+        if isinstance(error, commands.MissingPermissions):
+            return await ctx.send("You don’t have permission for that.")
+        if isinstance(error, commands.BotMissingPermissions):
+            return await ctx.send("I’m missing permissions to carry out this action.")
+        if isinstance(error, commands.MissingRequiredArgument):
+            return await ctx.send(f"Missing argument: `{error.param.name}`")
+        if isinstance(error, commands.BadArgument):
+            return await ctx.send("Wrong Argument, Not found.")
+
+        logging.exception("Unhandled error:", exc_info=error)
+        await ctx.send(f"❌ `{type(error).__name__}`")
+
+    bot.run(TOKEN)
+
+
+if __name__ == "__main__":
+    main()